@@ -74,11 +74,13 @@ async def run_quarterly_scan():
 
         logger.info(f"Quarterly scan complete: {result.tickers_scanned} tickers, {result.memos_generated} memos")
 
-        # 3. Submit memos to inbox
+        # 3. Submit memos to inbox (full memos read back from the scan's
+        # memo stream; high_conviction_memos only holds summaries)
         inbox_service = InboxService(db)
         submitted_memos = []
+        full_memos = result.full_memos()
 
-        for memo in result.high_conviction_memos:
+        for memo in full_memos:
             try:
                 created_memo = inbox_service.create_memo(
                     ticker=memo["ticker"],
@@ -112,7 +114,7 @@ async def run_quarterly_scan():
                 await email_service.notify_scan_complete(
                     tickers_scanned=result.tickers_scanned,
                     memos_generated=len(submitted_memos),
-                    memos=result.high_conviction_memos,
+                    memos=full_memos,
                 )
                 logger.info("Email notification sent")
             except Exception as e:
@@ -168,11 +170,13 @@ async def run_manual_scan(tickers: list[str]) -> dict:
             universe_name="manual_scan",
         )
 
-        # Submit memos to inbox
+        # Submit memos to inbox (full memos read back from the scan's
+        # memo stream; high_conviction_memos only holds summaries)
         inbox_service = InboxService(db)
         submitted_count = 0
+        full_memos = result.full_memos()
 
-        for memo in result.high_conviction_memos:
+        for memo in full_memos:
             try:
                 inbox_service.create_memo(
                     ticker=memo["ticker"],
@@ -201,12 +205,12 @@ async def run_manual_scan(tickers: list[str]) -> dict:
         watchlist_service.mark_scanned()
 
         # Send email if configured
-        if email_service.is_configured() and result.high_conviction_memos:
+        if email_service.is_configured() and full_memos:
             try:
                 await email_service.notify_scan_complete(
                     tickers_scanned=result.tickers_scanned,
                     memos_generated=submitted_count,
-                    memos=result.high_conviction_memos,
+                    memos=full_memos,
                 )
             except Exception as e:
                 logger.error(f"Failed to send email notification: {e}")
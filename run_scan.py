@@ -103,14 +103,16 @@ async def run_scan(tickers: list[str], analysts: list[str] = None):
         for error in result.errors[:5]:
             print(f"  - {error}")
 
-    # Submit memos to backend
-    if result.high_conviction_memos:
-        print(f"\nSubmitting {len(result.high_conviction_memos)} memos to backend...")
+    # Submit memos to backend; full_memos() reads the complete memos back
+    # from the scan's stream file (the in-memory list only holds summaries)
+    memos = result.full_memos()
+    if memos:
+        print(f"\nSubmitting {len(memos)} memos to backend...")
         submitted = 0
-        for memo in result.high_conviction_memos:
+        for memo in memos:
             if submit_memo_to_backend(memo):
                 submitted += 1
-        print(f"\nSubmitted {submitted}/{len(result.high_conviction_memos)} memos successfully!")
+        print(f"\nSubmitted {submitted}/{len(memos)} memos successfully!")
     else:
         print("\nNo high-conviction memos to submit.")
 
@@ -2,17 +2,19 @@ from src.graph.state import AgentState, show_agent_reasoning
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items, get_prices
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import json
 from typing import Optional
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, call_llm_streaming
 from src.utils.api_key import get_api_key_from_state
-from src.agents.memo_schema import InvestmentMemo, should_generate_memo, generate_investment_memo
+from src.agents.memo_schema import InvestmentMemo, MEMO_CONVICTION_THRESHOLD, generate_investment_memo
 
 
 class BillAckmanSignal(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     signal: Literal["bullish", "bearish", "neutral"]
     confidence: float
     reasoning: str
@@ -22,6 +24,8 @@ class BillAckmanSignal(BaseModel):
 
 class BillAckmanMemoOutput(BaseModel):
     """Extended output model for generating investment memos."""
+    model_config = ConfigDict(frozen=True)
+
     signal: Literal["bullish", "bearish", "neutral"]
     confidence: int = Field(description="Confidence 0-100")
     reasoning: str = Field(description="Reasoning for the decision")
@@ -30,6 +34,13 @@ class BillAckmanMemoOutput(BaseModel):
     bear_case: list[str] = Field(description="3 bullet points for bear case")
     target_price: float = Field(description="Target price based on valuation")
 
+
+# Precompiled once at import time so the schema isn't rebuilt per ticker;
+# passed to the provider's structured-output API via call_llm(response_schema=...).
+_ACKMAN_SIGNAL_SCHEMA = BillAckmanSignal.model_json_schema()
+_ACKMAN_MEMO_SCHEMA = BillAckmanMemoOutput.model_json_schema()
+
+
 def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     """
     Analyzes stocks using Bill Ackman's investing principles and LLM reasoning.
@@ -120,12 +131,12 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
         )
         
         ackman_analysis[ticker] = {
-            "signal": ackman_output.signal,
-            "confidence": ackman_output.confidence,
-            "reasoning": ackman_output.reasoning
+            "signal": ackman_output["signal"],
+            "confidence": ackman_output["confidence"],
+            "reasoning": ackman_output["reasoning"]
         }
-        
-        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output.reasoning)
+
+        progress.update_status(agent_id, ticker, "Done", analysis=ackman_output["reasoning"])
     
     # Wrap results in a single message for the chain
     message = HumanMessage(
@@ -415,11 +426,14 @@ def generate_ackman_output(
     analysis_data: dict[str, any],
     state: AgentState,
     agent_id: str,
-) -> BillAckmanSignal:
+) -> dict:
     """
     Generates investment decisions in the style of Bill Ackman.
-    Includes more explicit references to brand strength, activism potential, 
+    Includes more explicit references to brand strength, activism potential,
     catalysts, and management changes in the system prompt.
+
+    Returns the parsed signal as a dict — the caller immediately re-serializes
+    it, so materializing a BillAckmanSignal would be wasted work.
     """
     template = ChatPromptTemplate.from_messages([
         (
@@ -451,12 +465,8 @@ def generate_ackman_output(
             Analysis Data for {ticker}:
             {analysis_data}
 
-            Return your output in strictly valid JSON:
-            {{
-              "signal": "bullish" | "bearish" | "neutral",
-              "confidence": float (0-100),
-              "reasoning": "string"
-            }}
+            Respond in JSON matching this schema:
+            {{"signal": "bullish" | "neutral" | "bearish", "confidence": float (0-100), "reasoning": "string"}}
             """
         )
     ])
@@ -474,11 +484,13 @@ def generate_ackman_output(
         )
 
     return call_llm(
-        prompt=prompt, 
-        pydantic_model=BillAckmanSignal, 
-        agent_name=agent_id, 
+        prompt=prompt,
+        pydantic_model=BillAckmanSignal,
+        agent_name=agent_id,
         state=state,
         default_factory=create_default_bill_ackman_signal,
+        response_schema=_ACKMAN_SIGNAL_SCHEMA,
+        return_dict=True,
     )
 
 def generate_bill_ackman_memo(
@@ -487,8 +499,17 @@ def generate_bill_ackman_memo(
         current_price: float,
         state: AgentState,
         agent_id: str = "bill_ackman_agent",
-) -> BillAckmanMemoOutput:
-    """Generate full investment memo with thesis, bull/bear cases, and target price."""
+        stream: bool = False,
+) -> dict:
+    """Generate full investment memo with thesis, bull/bear cases, and target price.
+
+    Returns the parsed memo as a dict (validated against the precompiled schema
+    by the provider) so the final InvestmentMemo is constructed only once.
+
+    When stream=True, returns an iterator of progressively more-complete memo
+    dicts instead of blocking for the full completion, so consumers can start
+    rendering the thesis while later sections are still generating.
+    """
 
     # Get valuation data for target price calculation
     market_cap = analysis_data.get("market_cap")
@@ -533,18 +554,7 @@ Based on the analysis facts, create a comprehensive investment memo with:
 3. A 2-3 sentence investment thesis summarizing the key investment case
 4. Exactly 3 bullet points for the bull case
 5. Exactly 3 bullet points for the bear case
-6. A target price based on activist potential, catalysts, and margin of safety
-
-Return JSON only with exactly these fields:
-{
-  "signal": "bullish" or "bearish",
-  "confidence": int 0-100,
-  "reasoning": "brief reasoning",
-  "thesis": "2-3 sentence investment thesis",
-  "bull_case": ["point 1", "point 2", "point 3"],
-  "bear_case": ["point 1", "point 2", "point 3"],
-  "target_price": float
-}"""
+6. A target price based on activist potential, catalysts, and margin of safety"""
             ),
             (
                 "human",
@@ -569,12 +579,22 @@ Return JSON only with exactly these fields:
             target_price=target_price_estimate if target_price_estimate else current_price
         )
 
+    if stream:
+        return call_llm_streaming(
+            prompt=prompt,
+            pydantic_model=BillAckmanMemoOutput,
+            agent_name=agent_id,
+            state=state,
+        )
+
     return call_llm(
         prompt=prompt,
         pydantic_model=BillAckmanMemoOutput,
         agent_name=agent_id,
         state=state,
         default_factory=create_default_memo,
+        response_schema=_ACKMAN_MEMO_SCHEMA,
+        return_dict=True,
     )
 
 
@@ -609,7 +629,7 @@ def run_bill_ackman_with_memo(
         signal = analysis.get("signal", "neutral")
 
         # Check if we should generate a memo
-        if should_generate_memo(confidence) and signal != "neutral":
+        if confidence >= MEMO_CONVICTION_THRESHOLD and signal != "neutral":
             progress.update_status(agent_id, ticker, "Generating investment memo")
 
             # Get market cap for analysis data
@@ -643,14 +663,14 @@ def run_bill_ackman_with_memo(
             memo = generate_investment_memo(
                 ticker=ticker,
                 analyst="Bill Ackman",
-                signal=memo_output.signal,
-                conviction=memo_output.confidence,
+                signal=memo_output["signal"],
+                conviction=memo_output["confidence"],
                 current_price=current_price,
-                target_price=memo_output.target_price,
+                target_price=memo_output["target_price"],
                 time_horizon="medium",
-                thesis=memo_output.thesis,
-                bull_case=memo_output.bull_case,
-                bear_case=memo_output.bear_case,
+                thesis=memo_output["thesis"],
+                bull_case=memo_output["bull_case"],
+                bear_case=memo_output["bear_case"],
                 metrics=key_metrics,
             )
 
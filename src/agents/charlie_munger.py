@@ -9,7 +9,7 @@ from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
 from src.utils.api_key import get_api_key_from_state
-from src.agents.memo_schema import InvestmentMemo, should_generate_memo, generate_investment_memo
+from src.agents.memo_schema import InvestmentMemo, MEMO_CONVICTION_THRESHOLD, generate_investment_memo
 
 
 class CharlieMungerSignal(BaseModel):
@@ -997,7 +997,7 @@ def run_charlie_munger_with_memo(
         signal = analysis.get("signal", "neutral")
 
         # Check if we should generate a memo
-        if should_generate_memo(confidence) and signal != "neutral":
+        if confidence >= MEMO_CONVICTION_THRESHOLD and signal != "neutral":
             progress.update_status(agent_id, ticker, "Generating investment memo")
 
             # Get market cap for analysis data
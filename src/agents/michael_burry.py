@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import functools
 import json
+import operator
 from typing import Optional
 from typing_extensions import Literal
 
+import numpy as np
+
 from src.graph.state import AgentState, show_agent_reasoning
-from langchain_core.messages import HumanMessage
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.prompt_values import ChatPromptValue
 from pydantic import BaseModel, Field
 
 from src.tools.api import (
@@ -21,7 +26,84 @@ from src.tools.api import (
 from src.utils.llm import call_llm
 from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
-from src.agents.memo_schema import InvestmentMemo, should_generate_memo, generate_investment_memo
+from src.agents.memo_schema import InvestmentMemo, MEMO_CONVICTION_THRESHOLD, generate_investment_memo, generate_investment_memo_json
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# The agent and the memo path both hit these endpoints for the same
+# (ticker, end_date); memoizing avoids the duplicate round-trips. api_key is
+# part of the key so multi-tenant callers don't cross-contaminate. Falsy
+# results (transient fetch failures, empty payloads) are never stored, so a
+# flaky call retries next time instead of pinning "no data" for the process.
+_FETCH_CACHE_MAX = 1024
+_market_cap_cache: dict = {}
+_financial_metrics_cache: dict = {}
+
+
+def _cache_put(cache: dict, key, value):
+    if len(cache) >= _FETCH_CACHE_MAX:
+        cache.clear()
+    cache[key] = value
+
+
+def _cached_market_cap(ticker: str, end_date: str, api_key: str | None):
+    key = (ticker, end_date, api_key)
+    if key in _market_cap_cache:
+        return _market_cap_cache[key]
+    value = get_market_cap(ticker, end_date, api_key=api_key)
+    if value:
+        _cache_put(_market_cap_cache, key, value)
+    return value
+
+
+def _cached_financial_metrics(ticker: str, end_date: str, period: str, limit: int, api_key: str | None):
+    key = (ticker, end_date, period, limit, api_key)
+    if key in _financial_metrics_cache:
+        return _financial_metrics_cache[key]
+    value = get_financial_metrics(ticker, end_date, period=period, limit=limit, api_key=api_key)
+    if value:
+        _cache_put(_financial_metrics_cache, key, value)
+    return value
+
+
+def clear_burry_caches():
+    """Reset the memoized fetches — for long-running processes and tests."""
+    _market_cap_cache.clear()
+    _financial_metrics_cache.clear()
+
+
+# The four sub-analyzers always report fixed max_scores (6 + 3 + 2 + 1), so
+# the signal cutoffs are constants. Working in tenths keeps the comparison in
+# integer arithmetic (0.7 * 12 has no exact float representation).
+_BURRY_MAX_SCORE = 12
+_BULL_THRESHOLD = int(0.7 * _BURRY_MAX_SCORE * 10)  # total_score * 10 >= 84 -> bullish
+_BEAR_THRESHOLD = int(0.3 * _BURRY_MAX_SCORE * 10)  # total_score * 10 <= 36 -> bearish
+
+
+@functools.lru_cache(maxsize=64)
+def _window_start(end_date: str, days: int = 365) -> str:
+    """Start of the lookback window ending at end_date, memoized per date.
+
+    Repeated runs over the same end_date (multiple tickers, multiple agents)
+    skip the ISO re-parse and timedelta arithmetic.
+    """
+    return (datetime.fromisoformat(end_date) - timedelta(days=days)).date().isoformat()
 
 
 class MichaelBurrySignal(BaseModel):
@@ -44,6 +126,14 @@ class MichaelBurryMemoOutput(BaseModel):
     bear_case: list[str] = Field(description="3 bullet points for bear case")
     target_price: float = Field(description="Target price based on valuation")
 
+
+# Precompiled JSON schemas: lets call_llm bind the provider's native
+# structured-output grammar and hand back a plain dict, skipping model
+# materialization on the hot path (the dict is re-serialized immediately).
+_BURRY_SIGNAL_SCHEMA = MichaelBurrySignal.model_json_schema()
+_BURRY_MEMO_SCHEMA = MichaelBurryMemoOutput.model_json_schema()
+
+
 def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"):
     """Analyse stocks using Michael Burry's deep‑value, contrarian framework."""
     api_key = get_api_key_from_state(state, "FINANCIAL_DATASETS_API_KEY")
@@ -52,57 +142,55 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
     tickers: list[str] = data["tickers"]
 
     # We look one year back for insider trades / news flow
-    start_date = (datetime.fromisoformat(end_date) - timedelta(days=365)).date().isoformat()
+    start_date = _window_start(end_date)
 
     analysis_data: dict[str, dict] = {}
     burry_analysis: dict[str, dict] = {}
 
-    for ticker in tickers:
+    def _analyze_one(ticker: str) -> tuple[str, dict, dict]:
+        """Fetch data, run sub-analyses, and generate the LLM signal for one ticker."""
         # ------------------------------------------------------------------
-        # Fetch raw data
+        # Fetch raw data — the five endpoints are independent, so overlap them
         # ------------------------------------------------------------------
-        progress.update_status(agent_id, ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5, api_key=api_key)
-
-        progress.update_status(agent_id, ticker, "Fetching line items")
-        line_items = search_line_items(
-            ticker,
-            [
-                "free_cash_flow",
-                "net_income",
-                "total_debt",
-                "cash_and_equivalents",
-                "total_assets",
-                "total_liabilities",
-                "outstanding_shares",
-                "issuance_or_purchase_of_equity_shares",
-            ],
-            end_date,
-            api_key=api_key,
-        )
-
-        progress.update_status(agent_id, ticker, "Fetching insider trades")
-        insider_trades = get_insider_trades(ticker, end_date=end_date, start_date=start_date)
-
-        progress.update_status(agent_id, ticker, "Fetching company news")
-        news = get_company_news(ticker, end_date=end_date, start_date=start_date, limit=250)
+        progress.update_status(agent_id, ticker, "Fetching data")
+        with ThreadPoolExecutor(max_workers=5) as fetch_pool:
+            metrics_f = fetch_pool.submit(_cached_financial_metrics, ticker, end_date, "ttm", 5, api_key)
+            line_items_f = fetch_pool.submit(
+                search_line_items,
+                ticker,
+                [
+                    "free_cash_flow",
+                    "net_income",
+                    "total_debt",
+                    "cash_and_equivalents",
+                    "total_assets",
+                    "total_liabilities",
+                    "outstanding_shares",
+                    "issuance_or_purchase_of_equity_shares",
+                ],
+                end_date,
+                api_key=api_key,
+            )
+            insider_trades_f = fetch_pool.submit(get_insider_trades, ticker, end_date=end_date, start_date=start_date)
+            news_f = fetch_pool.submit(get_company_news, ticker, end_date=end_date, start_date=start_date, limit=250)
+            market_cap_f = fetch_pool.submit(_cached_market_cap, ticker, end_date, api_key)
 
-        progress.update_status(agent_id, ticker, "Fetching market cap")
-        market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+            metrics = metrics_f.result()
+            line_items = line_items_f.result()
+            insider_trades = insider_trades_f.result()
+            news = news_f.result()
+            market_cap = market_cap_f.result()
 
         # ------------------------------------------------------------------
         # Run sub‑analyses
         # ------------------------------------------------------------------
-        progress.update_status(agent_id, ticker, "Analyzing value")
-        value_analysis = _analyze_value(metrics, line_items, market_cap)
-
-        progress.update_status(agent_id, ticker, "Analyzing balance sheet")
-        balance_sheet_analysis = _analyze_balance_sheet(metrics, line_items)
-
-        progress.update_status(agent_id, ticker, "Analyzing insider activity")
+        progress.update_status(agent_id, ticker, "Analyzing fundamentals")
+        # Most-recent records come first; resolve them once and pass explicitly
+        latest_metrics = metrics[0] if metrics else None
+        latest_item = line_items[0] if line_items else None
+        value_analysis = _analyze_value(latest_metrics, latest_item, market_cap)
+        balance_sheet_analysis = _analyze_balance_sheet(latest_metrics, latest_item)
         insider_analysis = _analyze_insider_activity(insider_trades)
-
-        progress.update_status(agent_id, ticker, "Analyzing contrarian sentiment")
         contrarian_analysis = _analyze_contrarian_sentiment(news)
 
         # ------------------------------------------------------------------
@@ -120,10 +208,11 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
             + insider_analysis["max_score"]
             + contrarian_analysis["max_score"]
         )
+        assert max_score == _BURRY_MAX_SCORE, f"unexpected max_score {max_score}"
 
-        if total_score >= 0.7 * max_score:
+        if total_score * 10 >= _BULL_THRESHOLD:
             signal = "bullish"
-        elif total_score <= 0.3 * max_score:
+        elif total_score * 10 <= _BEAR_THRESHOLD:
             signal = "bearish"
         else:
             signal = "neutral"
@@ -131,7 +220,7 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
         # ------------------------------------------------------------------
         # Collect data for LLM reasoning & output
         # ------------------------------------------------------------------
-        analysis_data[ticker] = {
+        ticker_analysis = {
             "signal": signal,
             "score": total_score,
             "max_score": max_score,
@@ -142,26 +231,55 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
             "market_cap": market_cap,
         }
 
-        progress.update_status(agent_id, ticker, "Generating LLM output")
-        burry_output = _generate_burry_output(
-            ticker=ticker,
-            analysis_data=analysis_data,
-            state=state,
-            agent_id=agent_id,
-        )
+        if signal == "neutral" and state["metadata"].get("skip_neutral_llm"):
+            # Deep in the neutral band the LLM usually just restates the
+            # heuristics, so synthesize the signal and skip the round-trip.
+            progress.update_status(agent_id, ticker, "Skipping LLM (neutral)")
+            burry_output = {
+                "signal": "neutral",
+                "confidence": 50.0,
+                "reasoning": "; ".join(
+                    [
+                        *value_analysis["details"],
+                        *balance_sheet_analysis["details"],
+                        *insider_analysis["details"],
+                        *contrarian_analysis["details"],
+                    ]
+                ),
+            }
+        else:
+            progress.update_status(agent_id, ticker, "Generating LLM output")
+            burry_output = _generate_burry_output(
+                ticker=ticker,
+                analysis_data={ticker: ticker_analysis},
+                state=state,
+                agent_id=agent_id,
+            )
 
-        burry_analysis[ticker] = {
-            "signal": burry_output.signal,
-            "confidence": burry_output.confidence,
-            "reasoning": burry_output.reasoning,
+        signal_entry = {
+            "signal": burry_output["signal"],
+            "confidence": burry_output["confidence"],
+            "reasoning": burry_output["reasoning"],
         }
 
-        progress.update_status(agent_id, ticker, "Done", analysis=burry_output.reasoning)
+        progress.update_status(agent_id, ticker, "Done", analysis=burry_output["reasoning"])
+        return ticker, ticker_analysis, signal_entry
+
+    # Per-ticker work is dominated by HTTP latency, so overlap tickers in a pool
+    if len(tickers) <= 1:
+        results = [_analyze_one(ticker) for ticker in tickers]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+            results = list(executor.map(_analyze_one, tickers))
+
+    for ticker, ticker_analysis, signal_entry in results:
+        analysis_data[ticker] = ticker_analysis
+        burry_analysis[ticker] = signal_entry
 
     # ----------------------------------------------------------------------
     # Return to the graph
     # ----------------------------------------------------------------------
-    message = HumanMessage(content=json.dumps(burry_analysis), name=agent_id)
+    message = HumanMessage(content=_dumps(burry_analysis), name=agent_id)
 
     if state["metadata"].get("show_reasoning"):
         show_agent_reasoning(burry_analysis, "Michael Burry Agent")
@@ -178,14 +296,44 @@ def michael_burry_agent(state: AgentState, agent_id: str = "michael_burry_agent"
 ###############################################################################
 
 
-def _latest_line_item(line_items: list):
-    """Return the most recent line‑item object or *None*."""
-    return line_items[0] if line_items else None
+# Precomputed attribute extractors: one attrgetter call instead of a chain of
+# getattr(..., None) lookups, and an explicit statement of the fields each
+# analyzer depends on. Line items are dynamic models, so fall back to per-field
+# getattr when a requested field is missing entirely.
+_LINE_ITEM_ATTRS = operator.attrgetter("free_cash_flow", "cash_and_equivalents", "total_debt")
+_METRIC_ATTRS = operator.attrgetter("ev_to_ebit", "debt_to_equity")
+
+
+def _extract_line_item_attrs(item) -> tuple:
+    """Return (free_cash_flow, cash_and_equivalents, total_debt) with None defaults."""
+    if item is None:
+        return (None, None, None)
+    try:
+        return _LINE_ITEM_ATTRS(item)
+    except AttributeError:
+        return (
+            getattr(item, "free_cash_flow", None),
+            getattr(item, "cash_and_equivalents", None),
+            getattr(item, "total_debt", None),
+        )
+
+
+def _extract_metric_attrs(metric) -> tuple:
+    """Return (ev_to_ebit, debt_to_equity) with None defaults."""
+    if metric is None:
+        return (None, None)
+    try:
+        return _METRIC_ATTRS(metric)
+    except AttributeError:
+        return (
+            getattr(metric, "ev_to_ebit", None),
+            getattr(metric, "debt_to_equity", None),
+        )
 
 
 # ----- Value ----------------------------------------------------------------
 
-def _analyze_value(metrics, line_items, market_cap):
+def _analyze_value(latest_metrics, latest_item, market_cap):
     """Free cash‑flow yield, EV/EBIT, other classic deep‑value metrics."""
 
     max_score = 6  # 4 pts for FCF‑yield, 2 pts for EV/EBIT
@@ -193,8 +341,7 @@ def _analyze_value(metrics, line_items, market_cap):
     details: list[str] = []
 
     # Free‑cash‑flow yield
-    latest_item = _latest_line_item(line_items)
-    fcf = getattr(latest_item, "free_cash_flow", None) if latest_item else None
+    fcf, _, _ = _extract_line_item_attrs(latest_item)
     if fcf is not None and market_cap:
         fcf_yield = fcf / market_cap
         if fcf_yield >= 0.15:
@@ -212,8 +359,8 @@ def _analyze_value(metrics, line_items, market_cap):
         details.append("FCF data unavailable")
 
     # EV/EBIT (from financial metrics)
-    if metrics:
-        ev_ebit = getattr(metrics[0], "ev_to_ebit", None)
+    if latest_metrics is not None:
+        ev_ebit, _ = _extract_metric_attrs(latest_metrics)
         if ev_ebit is not None:
             if ev_ebit < 6:
                 score += 2
@@ -228,22 +375,19 @@ def _analyze_value(metrics, line_items, market_cap):
     else:
         details.append("Financial metrics unavailable")
 
-    return {"score": score, "max_score": max_score, "details": "; ".join(details)}
+    return {"score": score, "max_score": max_score, "details": details}
 
 
 # ----- Balance sheet --------------------------------------------------------
 
-def _analyze_balance_sheet(metrics, line_items):
+def _analyze_balance_sheet(latest_metrics, latest_item):
     """Leverage and liquidity checks."""
 
     max_score = 3
     score = 0
     details: list[str] = []
 
-    latest_metrics = metrics[0] if metrics else None
-    latest_item = _latest_line_item(line_items)
-
-    debt_to_equity = getattr(latest_metrics, "debt_to_equity", None) if latest_metrics else None
+    _, debt_to_equity = _extract_metric_attrs(latest_metrics)
     if debt_to_equity is not None:
         if debt_to_equity < 0.5:
             score += 2
@@ -258,8 +402,7 @@ def _analyze_balance_sheet(metrics, line_items):
 
     # Quick liquidity sanity check (cash vs total debt)
     if latest_item is not None:
-        cash = getattr(latest_item, "cash_and_equivalents", None)
-        total_debt = getattr(latest_item, "total_debt", None)
+        _, cash, total_debt = _extract_line_item_attrs(latest_item)
         if cash is not None and total_debt is not None:
             if cash > total_debt:
                 score += 1
@@ -269,7 +412,7 @@ def _analyze_balance_sheet(metrics, line_items):
         else:
             details.append("Cash/debt data unavailable")
 
-    return {"score": score, "max_score": max_score, "details": "; ".join(details)}
+    return {"score": score, "max_score": max_score, "details": details}
 
 
 # ----- Insider activity -----------------------------------------------------
@@ -283,10 +426,24 @@ def _analyze_insider_activity(insider_trades):
 
     if not insider_trades:
         details.append("No insider trade data")
-        return {"score": score, "max_score": max_score, "details": "; ".join(details)}
-
-    shares_bought = sum(t.transaction_shares or 0 for t in insider_trades if (t.transaction_shares or 0) > 0)
-    shares_sold = abs(sum(t.transaction_shares or 0 for t in insider_trades if (t.transaction_shares or 0) < 0))
+        return {"score": score, "max_score": max_score, "details": details}
+
+    if len(insider_trades) < 32:
+        # NumPy setup overhead isn't worth it for small histories; one pass,
+        # one attribute read per trade, no abs() on the sell side.
+        shares_bought = 0
+        shares_sold = 0
+        for t in insider_trades:
+            s = t.transaction_shares or 0
+            if s > 0:
+                shares_bought += s
+            elif s < 0:
+                shares_sold -= s
+    else:
+        # Single vectorized pass instead of two Python-level generator sums
+        arr = np.fromiter((t.transaction_shares or 0 for t in insider_trades), dtype=np.float64, count=len(insider_trades))
+        shares_bought = float(arr[arr > 0].sum())
+        shares_sold = float(-arr[arr < 0].sum())
     net = shares_bought - shares_sold
     if net > 0:
         score += 2 if net / max(shares_sold, 1) > 1 else 1
@@ -294,11 +451,16 @@ def _analyze_insider_activity(insider_trades):
     else:
         details.append("Net insider selling")
 
-    return {"score": score, "max_score": max_score, "details": "; ".join(details)}
+    return {"score": score, "max_score": max_score, "details": details}
 
 
 # ----- Contrarian sentiment -------------------------------------------------
 
+# Negative-sentiment labels, precompiled for O(1) membership tests. Common
+# casings are included so the per-row .lower() allocation is usually skipped.
+_NEG_SENTIMENTS = frozenset({"negative", "bearish", "Negative", "Bearish", "NEGATIVE", "BEARISH"})
+
+
 def _analyze_contrarian_sentiment(news):
     """Very rough gauge: a wall of recent negative headlines can be a *positive* for a contrarian."""
 
@@ -308,11 +470,11 @@ def _analyze_contrarian_sentiment(news):
 
     if not news:
         details.append("No recent news")
-        return {"score": score, "max_score": max_score, "details": "; ".join(details)}
+        return {"score": score, "max_score": max_score, "details": details}
 
     # Count negative sentiment articles
     sentiment_negative_count = sum(
-        1 for n in news if n.sentiment and n.sentiment.lower() in ["negative", "bearish"]
+        1 for n in news if (s := n.sentiment) and (s in _NEG_SENTIMENTS or s.lower() in _NEG_SENTIMENTS)
     )
     
     if sentiment_negative_count >= 5:
@@ -321,26 +483,18 @@ def _analyze_contrarian_sentiment(news):
     else:
         details.append("Limited negative press")
 
-    return {"score": score, "max_score": max_score, "details": "; ".join(details)}
+    return {"score": score, "max_score": max_score, "details": details}
 
 
 ###############################################################################
 # LLM generation
 ###############################################################################
 
-def _generate_burry_output(
-    ticker: str,
-    analysis_data: dict,
-    state: AgentState,
-    agent_id: str,
-) -> MichaelBurrySignal:
-    """Call the LLM to craft the final trading signal in Burry's voice."""
-
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are an AI agent emulating Dr. Michael J. Burry. Your mandate:
+# The system prompts have no variables, so cache the SystemMessage objects
+# outright; the human prompts are plain f-string templates rendered with
+# str.format, bypassing LangChain's per-call template machinery entirely.
+_BURRY_SIGNAL_SYSTEM = SystemMessage(
+    content="""You are an AI agent emulating Dr. Michael J. Burry. Your mandate:
                 - Hunt for deep value in US equities using hard numbers (free cash flow, EV/EBIT, balance sheet)
                 - Be contrarian: hatred in the press can be your friend if fundamentals are solid
                 - Focus on downside first – avoid leveraged balance sheets
@@ -356,11 +510,10 @@ def _generate_burry_output(
                 
                 For example, if bullish: "FCF yield 12.8%. EV/EBIT 6.2. Debt-to-equity 0.4. Net insider buying 25k shares. Market missing value due to overreaction to recent litigation. Strong buy."
                 For example, if bearish: "FCF yield only 2.1%. Debt-to-equity concerning at 2.3. Management diluting shareholders. Pass."
-                """,
-            ),
-            (
-                "human",
-                """Based on the following data, create the investment signal as Michael Burry would:
+                """
+)
+
+_BURRY_SIGNAL_HUMAN = """Based on the following data, create the investment signal as Michael Burry would:
 
                 Analysis Data for {ticker}:
                 {analysis_data}
@@ -371,13 +524,24 @@ def _generate_burry_output(
                   "confidence": float between 0 and 100,
                   "reasoning": "string"
                 }}
-                """,
-            ),
+                """
+
+
+def _generate_burry_output(
+    ticker: str,
+    analysis_data: dict,
+    state: AgentState,
+    agent_id: str,
+) -> dict:
+    """Call the LLM to craft the final trading signal in Burry's voice."""
+
+    prompt = ChatPromptValue(
+        messages=[
+            _BURRY_SIGNAL_SYSTEM,
+            HumanMessage(content=_BURRY_SIGNAL_HUMAN.format(ticker=ticker, analysis_data=_dumps_pretty(analysis_data))),
         ]
     )
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
-
     # Default fallback signal in case parsing fails
     def create_default_michael_burry_signal():
         return MichaelBurrySignal(signal="neutral", confidence=0.0, reasoning="Parsing error – defaulting to neutral")
@@ -388,15 +552,43 @@ def _generate_burry_output(
         agent_name=agent_id,
         state=state,
         default_factory=create_default_michael_burry_signal,
+        response_schema=_BURRY_SIGNAL_SCHEMA,
+        return_dict=True,
     )
 
+_BURRY_MEMO_SYSTEM = SystemMessage(
+    content="""You are Michael Burry generating a detailed investment memo.
+
+Based on the analysis facts, create a comprehensive investment memo with:
+1. A clear bullish or bearish signal (not neutral - pick a direction)
+2. Confidence level 0-100
+3. A 2-3 sentence investment thesis summarizing the key investment case
+4. Exactly 3 bullet points for the bull case
+5. Exactly 3 bullet points for the bear case
+6. A target price based on short interest, contrarian value opportunities, and catalysts
+
+Return JSON only with exactly these fields:
+{
+  "signal": "bullish" or "bearish",
+  "confidence": int 0-100,
+  "reasoning": "brief reasoning",
+  "thesis": "2-3 sentence investment thesis",
+  "bull_case": ["point 1", "point 2", "point 3"],
+  "bear_case": ["point 1", "point 2", "point 3"],
+  "target_price": float
+}"""
+)
+
+_BURRY_MEMO_HUMAN = "Ticker: {ticker}\nFacts:\n{facts}\n\nGenerate the investment memo JSON."
+
+
 def generate_michael_burry_memo(
         ticker: str,
         analysis_data: dict[str, any],
         current_price: float,
         state: AgentState,
         agent_id: str = "michael_burry_agent",
-) -> MichaelBurryMemoOutput:
+) -> dict:
     """Generate full investment memo with thesis, bull/bear cases, and target price."""
 
     # Get valuation data for target price calculation
@@ -430,43 +622,13 @@ def generate_michael_burry_memo(
         "target_price_estimate": target_price_estimate,
     }
 
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are Michael Burry generating a detailed investment memo.
-
-Based on the analysis facts, create a comprehensive investment memo with:
-1. A clear bullish or bearish signal (not neutral - pick a direction)
-2. Confidence level 0-100
-3. A 2-3 sentence investment thesis summarizing the key investment case
-4. Exactly 3 bullet points for the bull case
-5. Exactly 3 bullet points for the bear case
-6. A target price based on short interest, contrarian value opportunities, and catalysts
-
-Return JSON only with exactly these fields:
-{
-  "signal": "bullish" or "bearish",
-  "confidence": int 0-100,
-  "reasoning": "brief reasoning",
-  "thesis": "2-3 sentence investment thesis",
-  "bull_case": ["point 1", "point 2", "point 3"],
-  "bear_case": ["point 1", "point 2", "point 3"],
-  "target_price": float
-}"""
-            ),
-            (
-                "human",
-                "Ticker: {ticker}\nFacts:\n{facts}\n\nGenerate the investment memo JSON."
-            ),
+    prompt = ChatPromptValue(
+        messages=[
+            _BURRY_MEMO_SYSTEM,
+            HumanMessage(content=_BURRY_MEMO_HUMAN.format(ticker=ticker, facts=_dumps_pretty(facts))),
         ]
     )
 
-    prompt = template.invoke({
-        "facts": json.dumps(facts, indent=2),
-        "ticker": ticker,
-    })
-
     def create_default_memo():
         return MichaelBurryMemoOutput(
             signal="neutral",
@@ -484,18 +646,22 @@ Return JSON only with exactly these fields:
         agent_name=agent_id,
         state=state,
         default_factory=create_default_memo,
+        response_schema=_BURRY_MEMO_SCHEMA,
+        return_dict=True,
     )
 
 
 def run_michael_burry_with_memo(
     state: AgentState,
     agent_id: str = "michael_burry_agent"
-) -> tuple[dict, dict[str, Optional[InvestmentMemo]]]:
+) -> tuple[dict, dict[str, Optional[InvestmentMemo | str]]]:
     """
     Run Michael Burry analysis and generate InvestmentMemo if conviction >= 70%.
 
     Returns:
-        tuple: (analysis_dict, dict of ticker -> InvestmentMemo or None)
+        tuple: (analysis_dict, dict of ticker -> InvestmentMemo or None).
+        When state metadata sets memo_output_format="json", memo values are
+        pre-serialized JSON strings instead of InvestmentMemo objects.
     """
     data = state["data"]
     end_date = data["end_date"]
@@ -518,11 +684,11 @@ def run_michael_burry_with_memo(
         signal = analysis.get("signal", "neutral")
 
         # Check if we should generate a memo
-        if should_generate_memo(confidence) and signal != "neutral":
+        if confidence >= MEMO_CONVICTION_THRESHOLD and signal != "neutral":
             progress.update_status(agent_id, ticker, "Generating investment memo")
 
-            # Get market cap for analysis data
-            market_cap = get_market_cap(ticker, end_date, api_key=api_key)
+            # Get market cap for analysis data (memoized — the agent already fetched it)
+            market_cap = _cached_market_cap(ticker, end_date, api_key)
 
             # Build analysis data dict
             analysis_data = {
@@ -548,18 +714,25 @@ def run_michael_burry_with_memo(
                 "market_cap": market_cap,
             }
 
-            # Create the InvestmentMemo
-            memo = generate_investment_memo(
+            # JSON-only consumers can skip the InvestmentMemo object entirely
+            memo_factory = (
+                generate_investment_memo_json
+                if state["metadata"].get("memo_output_format") == "json"
+                else generate_investment_memo
+            )
+
+            # Create the InvestmentMemo (or its JSON form)
+            memo = memo_factory(
                 ticker=ticker,
                 analyst="Michael Burry",
-                signal=memo_output.signal,
-                conviction=memo_output.confidence,
+                signal=memo_output["signal"],
+                conviction=memo_output["confidence"],
                 current_price=current_price,
-                target_price=memo_output.target_price,
+                target_price=memo_output["target_price"],
                 time_horizon="medium",
-                thesis=memo_output.thesis,
-                bull_case=memo_output.bull_case,
-                bear_case=memo_output.bear_case,
+                thesis=memo_output["thesis"],
+                bull_case=memo_output["bull_case"],
+                bear_case=memo_output["bear_case"],
                 metrics=key_metrics,
             )
 
@@ -1,15 +1,29 @@
 """Portfolio Manager Agent - aggregates signals and makes final trading decisions."""
-from src.graph.state import AgentState, show_agent_reasoning
-from langchain_core.messages import HumanMessage
-from pydantic import BaseModel, Field
+from src.graph.state import AgentState, get_aggregated_signals, queue_agent_reasoning
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.prompt_values import ChatPromptValue
+from pydantic import BaseModel, ConfigDict, Field
 import json
 from typing import Literal
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm, call_llm_streaming
 from src.utils.progress import progress
-from langchain_core.prompts import ChatPromptTemplate
+
+
+try:
+    import orjson
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, sort_keys=True, default=str)
 
 
 class PortfolioDecision(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     ticker: str
     action: Literal["buy", "sell", "hold"]
     quantity: int = Field(description="Number of shares to trade")
@@ -18,32 +32,32 @@ class PortfolioDecision(BaseModel):
 
 
 class PortfolioManagerOutput(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     decisions: list[PortfolioDecision]
 
 
+class PortfolioOutputEnvelope(BaseModel):
+    """Message payload: serialized in one pass by pydantic-core instead of
+    model_dump per decision followed by json.dumps."""
+
+    model_config = ConfigDict(frozen=True)
+
+    decisions: list[PortfolioDecision]
+    reasoning: str
+
+
 def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_manager"):
     """Aggregates analyst signals and risk assessment to make final trading decisions."""
     data = state["data"]
     tickers = data["tickers"]
     portfolio = data.get("portfolio", {})
-    analyst_signals = data.get("analyst_signals", {})
     risk_assessment = data.get("risk_assessment", {})
 
     progress.update_status(agent_id, None, "Analyzing portfolio decisions")
 
-    # Aggregate signals for each ticker
-    aggregated_signals = {}
-    for ticker in tickers:
-        ticker_signals = []
-        for analyst_id, signals in analyst_signals.items():
-            if ticker in signals:
-                ticker_signals.append({
-                    "analyst": analyst_id,
-                    "signal": signals[ticker].get("signal"),
-                    "confidence": signals[ticker].get("confidence"),
-                    "reasoning": signals[ticker].get("reasoning"),
-                })
-        aggregated_signals[ticker] = ticker_signals
+    # Shared ticker -> signals index, computed once per state
+    aggregated_signals = get_aggregated_signals(state)
 
     # Get current positions
     cash = portfolio.get("cash", 100000)
@@ -62,16 +76,19 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
         agent_id=agent_id,
     )
 
-    # Format output
-    portfolio_output = {
-        "decisions": [d.model_dump() for d in decisions.decisions],
-        "reasoning": "Aggregated analyst signals with risk management constraints",
-    }
+    # Format output: the message content goes straight through pydantic-core's
+    # serializer, skipping the intermediate per-decision dicts + json.dumps.
+    envelope = PortfolioOutputEnvelope(
+        decisions=decisions.decisions,
+        reasoning="Aggregated analyst signals with risk management constraints",
+    )
 
-    message = HumanMessage(content=json.dumps(portfolio_output), name=agent_id)
+    message = HumanMessage(content=envelope.model_dump_json(), name=agent_id)
+
+    portfolio_output = envelope.model_dump()
 
     if state["metadata"]["show_reasoning"]:
-        show_agent_reasoning(portfolio_output, agent_id)
+        queue_agent_reasoning(portfolio_output, agent_id)
 
     # Store decisions in state
     state["data"]["portfolio_decisions"] = portfolio_output
@@ -81,21 +98,12 @@ def portfolio_management_agent(state: AgentState, agent_id: str = "portfolio_man
     return {"messages": [message], "data": state["data"]}
 
 
-def generate_portfolio_decisions(
-    tickers: list[str],
-    aggregated_signals: dict,
-    risk_assessment: dict,
-    cash: float,
-    positions: dict,
-    state: AgentState,
-    agent_id: str,
-) -> PortfolioManagerOutput:
-    """Generate portfolio decisions using LLM."""
-
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are a portfolio manager making final trading decisions.
+# Static instruction blocks are kept byte-identical across calls and placed
+# first, so provider-side prefix caching (OpenAI automatic; Anthropic via
+# cache_control markers added in call_llm) can reuse them. All dynamic inputs
+# live in the human message, serialized with sort_keys for stable prefixes.
+_PM_SYSTEM = SystemMessage(
+    content="""You are a portfolio manager making final trading decisions.
 
 Based on analyst signals and risk assessment, decide for each ticker:
 - buy: If consensus is bullish with high confidence
@@ -105,14 +113,22 @@ Based on analyst signals and risk assessment, decide for each ticker:
 Consider:
 1. Analyst consensus and confidence levels
 2. Risk assessment recommendations
-3. Available cash: ${cash}
+3. Available cash
 4. Current positions
 
 Return JSON with decisions for each ticker."""
-        ),
-        (
-            "human",
-            """Tickers: {tickers}
+)
+
+_PM_SCHEMA_SYSTEM = SystemMessage(
+    content="""Return exactly:
+{
+  "decisions": [
+    {"ticker": "XXX", "action": "buy|sell|hold", "quantity": int, "confidence": int, "reasoning": "brief reason"}
+  ]
+}"""
+)
+
+_PM_HUMAN = """Tickers: {tickers}
 
 Analyst Signals:
 {signals}
@@ -123,24 +139,40 @@ Risk Assessment:
 Current Positions:
 {positions}
 
-Available Cash: ${cash}
+Available Cash: ${cash}"""
 
-Return exactly:
-{{
-  "decisions": [
-    {{"ticker": "XXX", "action": "buy|sell|hold", "quantity": int, "confidence": int, "reasoning": "brief reason"}}
-  ]
-}}"""
-        ),
-    ])
-
-    prompt = template.invoke({
-        "tickers": tickers,
-        "signals": json.dumps(aggregated_signals, indent=2),
-        "risk": json.dumps(risk_assessment, indent=2),
-        "positions": json.dumps(positions, indent=2),
-        "cash": cash,
-    })
+
+def generate_portfolio_decisions(
+    tickers: list[str],
+    aggregated_signals: dict,
+    risk_assessment: dict,
+    cash: float,
+    positions: dict,
+    state: AgentState,
+    agent_id: str,
+) -> PortfolioManagerOutput:
+    """Generate portfolio decisions using LLM."""
+
+    # Canonical ticker order: ["MSFT", "AAPL"] and ["AAPL", "MSFT"] are the
+    # same problem, and sorting makes them the same prompt bytes so provider
+    # prefix caches hit. Output is mapped back to the caller's order below.
+    tickers_sorted = sorted(tickers)
+
+    prompt = ChatPromptValue(
+        messages=[
+            _PM_SYSTEM,
+            _PM_SCHEMA_SYSTEM,
+            HumanMessage(
+                content=_PM_HUMAN.format(
+                    tickers=tickers_sorted,
+                    signals=_dumps_pretty(aggregated_signals),
+                    risk=_dumps_pretty(risk_assessment),
+                    positions=_dumps_pretty(positions),
+                    cash=cash,
+                )
+            ),
+        ]
+    )
 
     def create_default():
         return PortfolioManagerOutput(
@@ -156,10 +188,158 @@ Return exactly:
             ]
         )
 
-    return call_llm(
-        prompt=prompt,
-        pydantic_model=PortfolioManagerOutput,
-        agent_name=agent_id,
+    # Large decision lists take long enough to generate that streaming pays:
+    # partial parses overlap with the network wait, and the final complete
+    # parse is validated into the output model. Any streaming failure falls
+    # back to the regular blocking call below.
+    output = None
+    if len(tickers) > 20:
+        try:
+            final = None
+            for partial in call_llm_streaming(prompt, PortfolioManagerOutput, agent_id, state):
+                final = partial
+            if final is not None:
+                output = PortfolioManagerOutput.model_validate(final)
+        except Exception:
+            pass
+
+    if output is None:
+        output = call_llm(
+            prompt=prompt,
+            pydantic_model=PortfolioManagerOutput,
+            agent_name=agent_id,
+            state=state,
+            default_factory=create_default,
+        )
+
+    # Restore the caller's ticker order via each decision's ticker field
+    rank = {t: i for i, t in enumerate(tickers)}
+    return PortfolioManagerOutput(
+        decisions=sorted(output.decisions, key=lambda d: rank.get(d.ticker, len(rank)))
+    )
+
+
+# Per-ticker schema block for the async path: one decision per call keeps
+# each prompt small and lets the static prefix above stay cache-hot.
+_PM_TICKER_SCHEMA_SYSTEM = SystemMessage(
+    content="""Return exactly one decision:
+{"ticker": "XXX", "action": "buy|sell|hold", "quantity": int, "confidence": int, "reasoning": "brief reason"}"""
+)
+
+_PM_TICKER_HUMAN = """Ticker: {ticker}
+
+Analyst Signals:
+{signals}
+
+Risk Assessment:
+{risk}
+
+Current Position:
+{position}
+
+Available Cash: ${cash}"""
+
+
+async def agenerate_portfolio_decisions(
+    tickers: list[str],
+    aggregated_signals: dict,
+    risk_assessment: dict,
+    cash: float,
+    positions: dict,
+    state: AgentState,
+    agent_id: str,
+) -> PortfolioManagerOutput:
+    """Async portfolio decisions: one small LLM call per ticker, run concurrently.
+
+    Each ticker's prompt carries only its own signals and risk entry, so the
+    calls overlap via asyncio.gather and the static prefix stays cache-hot.
+    """
+    import asyncio
+
+    per_ticker_risk = risk_assessment.get("assessments", {}) if isinstance(risk_assessment, dict) else {}
+
+    def _default_for(ticker: str):
+        def factory():
+            return PortfolioDecision(
+                ticker=ticker,
+                action="hold",
+                quantity=0,
+                confidence=50,
+                reasoning="Insufficient data for decision",
+            )
+        return factory
+
+    calls = []
+    for ticker in tickers:
+        prompt = ChatPromptValue(
+            messages=[
+                _PM_SYSTEM,
+                _PM_TICKER_SCHEMA_SYSTEM,
+                HumanMessage(
+                    content=_PM_TICKER_HUMAN.format(
+                        ticker=ticker,
+                        signals=_dumps_pretty(aggregated_signals.get(ticker, [])),
+                        risk=_dumps_pretty(per_ticker_risk.get(ticker, {})),
+                        position=_dumps_pretty(positions.get(ticker, {})),
+                        cash=cash,
+                    )
+                ),
+            ]
+        )
+        calls.append(
+            acall_llm(
+                prompt=prompt,
+                pydantic_model=PortfolioDecision,
+                agent_name=agent_id,
+                state=state,
+                default_factory=_default_for(ticker),
+            )
+        )
+
+    decisions = list(await asyncio.gather(*calls))
+    return PortfolioManagerOutput(decisions=decisions)
+
+
+async def aportfolio_management_agent(state: AgentState, agent_id: str = "portfolio_manager"):
+    """Async variant of portfolio_management_agent with concurrent per-ticker calls."""
+    data = state["data"]
+    tickers = data["tickers"]
+    portfolio = data.get("portfolio", {})
+    risk_assessment = data.get("risk_assessment", {})
+
+    progress.update_status(agent_id, None, "Analyzing portfolio decisions")
+
+    aggregated_signals = get_aggregated_signals(state)
+
+    cash = portfolio.get("cash", 100000)
+    positions = portfolio.get("positions", {})
+
+    progress.update_status(agent_id, None, "Generating portfolio decisions")
+
+    decisions = await agenerate_portfolio_decisions(
+        tickers=tickers,
+        aggregated_signals=aggregated_signals,
+        risk_assessment=risk_assessment,
+        cash=cash,
+        positions=positions,
         state=state,
-        default_factory=create_default,
+        agent_id=agent_id,
+    )
+
+    envelope = PortfolioOutputEnvelope(
+        decisions=decisions.decisions,
+        reasoning="Aggregated analyst signals with risk management constraints",
     )
+
+    message = HumanMessage(content=envelope.model_dump_json(), name=agent_id)
+
+    portfolio_output = envelope.model_dump()
+
+    if state["metadata"]["show_reasoning"]:
+        queue_agent_reasoning(portfolio_output, agent_id)
+
+    state["data"]["portfolio_decisions"] = portfolio_output
+
+    progress.update_status(agent_id, None, "Done")
+
+    return {"messages": [message], "data": state["data"]}
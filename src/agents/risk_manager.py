@@ -1,15 +1,29 @@
 """Risk Manager Agent - evaluates risk exposure and provides risk-adjusted recommendations."""
-from src.graph.state import AgentState, show_agent_reasoning
-from langchain_core.messages import HumanMessage
-from pydantic import BaseModel, Field
+from src.graph.state import AgentState, get_aggregated_signals, queue_agent_reasoning
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.prompt_values import ChatPromptValue
+from pydantic import BaseModel, ConfigDict, Field
 import json
 from typing import Literal
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm
 from src.utils.progress import progress
-from langchain_core.prompts import ChatPromptTemplate
+
+
+try:
+    import orjson
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, sort_keys=True, default=str)
 
 
 class RiskAssessment(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     ticker: str
     risk_level: Literal["low", "medium", "high"]
     max_position_size: float = Field(description="Maximum recommended position size as % of portfolio")
@@ -18,32 +32,34 @@ class RiskAssessment(BaseModel):
 
 
 class RiskManagerOutput(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     assessments: list[RiskAssessment]
     overall_risk: Literal["low", "medium", "high"]
     recommendations: str
 
 
+class RiskAssessmentEnvelope(BaseModel):
+    """Message payload: serialized in one pass by pydantic-core instead of
+    model_dump per assessment followed by json.dumps."""
+
+    model_config = ConfigDict(frozen=True)
+
+    assessments: dict[str, RiskAssessment]
+    overall_risk: Literal["low", "medium", "high"]
+    recommendations: str
+
+
 def risk_management_agent(state: AgentState, agent_id: str = "risk_management_agent"):
     """Evaluates risk exposure and provides risk-adjusted recommendations."""
     data = state["data"]
     tickers = data["tickers"]
     portfolio = data.get("portfolio", {})
-    analyst_signals = data.get("analyst_signals", {})
 
     progress.update_status(agent_id, None, "Analyzing risk exposure")
 
-    # Aggregate signals for risk analysis
-    aggregated_signals = {}
-    for ticker in tickers:
-        ticker_signals = []
-        for analyst_id, signals in analyst_signals.items():
-            if ticker in signals:
-                ticker_signals.append({
-                    "analyst": analyst_id,
-                    "signal": signals[ticker].get("signal"),
-                    "confidence": signals[ticker].get("confidence"),
-                })
-        aggregated_signals[ticker] = ticker_signals
+    # Shared ticker -> signals index, computed once per state
+    aggregated_signals = get_aggregated_signals(state)
 
     # Get current positions
     positions = portfolio.get("positions", {})
@@ -61,17 +77,20 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
         agent_id=agent_id,
     )
 
-    # Format output
-    risk_assessment = {
-        "assessments": {a.ticker: a.model_dump() for a in risk_output.assessments},
-        "overall_risk": risk_output.overall_risk,
-        "recommendations": risk_output.recommendations,
-    }
+    # Format output: the message content goes straight through pydantic-core's
+    # serializer, skipping the intermediate per-assessment dicts + json.dumps.
+    envelope = RiskAssessmentEnvelope(
+        assessments={a.ticker: a for a in risk_output.assessments},
+        overall_risk=risk_output.overall_risk,
+        recommendations=risk_output.recommendations,
+    )
 
-    message = HumanMessage(content=json.dumps(risk_assessment), name=agent_id)
+    message = HumanMessage(content=envelope.model_dump_json(), name=agent_id)
+
+    risk_assessment = envelope.model_dump()
 
     if state["metadata"]["show_reasoning"]:
-        show_agent_reasoning(risk_assessment, agent_id)
+        queue_agent_reasoning(risk_assessment, agent_id)
 
     # Store risk assessment in state
     state["data"]["risk_assessment"] = risk_assessment
@@ -81,20 +100,12 @@ def risk_management_agent(state: AgentState, agent_id: str = "risk_management_ag
     return {"messages": [message], "data": state["data"]}
 
 
-def generate_risk_assessment(
-    tickers: list[str],
-    aggregated_signals: dict,
-    positions: dict,
-    cash: float,
-    state: AgentState,
-    agent_id: str,
-) -> RiskManagerOutput:
-    """Generate risk assessment using LLM."""
-
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are a risk manager evaluating investment risk.
+# Static instruction blocks are kept byte-identical across calls and placed
+# first, so provider-side prefix caching (OpenAI automatic; Anthropic via
+# cache_control markers added in call_llm) can reuse them. All dynamic inputs
+# live in the human message, serialized with sort_keys for stable prefixes.
+_RISK_SYSTEM = SystemMessage(
+    content="""You are a risk manager evaluating investment risk.
 
 For each ticker, assess:
 1. Risk level (low/medium/high) based on signal consensus and confidence
@@ -109,10 +120,20 @@ Risk Guidelines:
 - Diversification: no single position > 20%
 
 Also assess overall portfolio risk and provide recommendations."""
-        ),
-        (
-            "human",
-            """Tickers: {tickers}
+)
+
+_RISK_SCHEMA_SYSTEM = SystemMessage(
+    content="""Return exactly:
+{
+  "assessments": [
+    {"ticker": "XXX", "risk_level": "low|medium|high", "max_position_size": float, "stop_loss": float, "reasoning": "brief reason"}
+  ],
+  "overall_risk": "low|medium|high",
+  "recommendations": "portfolio-level risk advice"
+}"""
+)
+
+_RISK_HUMAN = """Tickers: {tickers}
 
 Analyst Signals:
 {signals}
@@ -120,25 +141,38 @@ Analyst Signals:
 Current Positions:
 {positions}
 
-Available Cash: ${cash}
+Available Cash: ${cash}"""
 
-Return exactly:
-{{
-  "assessments": [
-    {{"ticker": "XXX", "risk_level": "low|medium|high", "max_position_size": float, "stop_loss": float, "reasoning": "brief reason"}}
-  ],
-  "overall_risk": "low|medium|high",
-  "recommendations": "portfolio-level risk advice"
-}}"""
-        ),
-    ])
 
-    prompt = template.invoke({
-        "tickers": tickers,
-        "signals": json.dumps(aggregated_signals, indent=2),
-        "positions": json.dumps(positions, indent=2),
-        "cash": cash,
-    })
+def generate_risk_assessment(
+    tickers: list[str],
+    aggregated_signals: dict,
+    positions: dict,
+    cash: float,
+    state: AgentState,
+    agent_id: str,
+) -> RiskManagerOutput:
+    """Generate risk assessment using LLM."""
+
+    # Canonical ticker order: ["MSFT", "AAPL"] and ["AAPL", "MSFT"] are the
+    # same problem, and sorting makes them the same prompt bytes so provider
+    # prefix caches hit. Output is mapped back to the caller's order below.
+    tickers_sorted = sorted(tickers)
+
+    prompt = ChatPromptValue(
+        messages=[
+            _RISK_SYSTEM,
+            _RISK_SCHEMA_SYSTEM,
+            HumanMessage(
+                content=_RISK_HUMAN.format(
+                    tickers=tickers_sorted,
+                    signals=_dumps_pretty(aggregated_signals),
+                    positions=_dumps_pretty(positions),
+                    cash=cash,
+                )
+            ),
+        ]
+    )
 
     def create_default():
         return RiskManagerOutput(
@@ -156,10 +190,155 @@ Return exactly:
             recommendations="Maintain diversified positions with appropriate stop losses."
         )
 
-    return call_llm(
+    output = call_llm(
         prompt=prompt,
         pydantic_model=RiskManagerOutput,
         agent_name=agent_id,
         state=state,
         default_factory=create_default,
     )
+
+    # Restore the caller's ticker order via each assessment's ticker field
+    rank = {t: i for i, t in enumerate(tickers)}
+    return RiskManagerOutput(
+        assessments=sorted(output.assessments, key=lambda a: rank.get(a.ticker, len(rank))),
+        overall_risk=output.overall_risk,
+        recommendations=output.recommendations,
+    )
+
+
+# Per-ticker schema block for the async path: one assessment per call keeps
+# each prompt small and lets the static prefix above stay cache-hot.
+_RISK_TICKER_SCHEMA_SYSTEM = SystemMessage(
+    content="""Return exactly one assessment:
+{"ticker": "XXX", "risk_level": "low|medium|high", "max_position_size": float, "stop_loss": float, "reasoning": "brief reason"}"""
+)
+
+_RISK_TICKER_HUMAN = """Ticker: {ticker}
+
+Analyst Signals:
+{signals}
+
+Current Position:
+{position}
+
+Available Cash: ${cash}"""
+
+_RISK_SEVERITY = {"low": 0, "medium": 1, "high": 2}
+
+
+async def agenerate_risk_assessment(
+    tickers: list[str],
+    aggregated_signals: dict,
+    positions: dict,
+    cash: float,
+    state: AgentState,
+    agent_id: str,
+) -> RiskManagerOutput:
+    """Async risk assessment: one small LLM call per ticker, run concurrently.
+
+    Instead of a single giant prompt, each ticker gets its own prompt and the
+    calls overlap via asyncio.gather, so wall-clock time is bounded by the
+    slowest call rather than the sum. Overall portfolio risk is derived from
+    the per-ticker results.
+    """
+    import asyncio
+
+    def _default_for(ticker: str):
+        def factory():
+            return RiskAssessment(
+                ticker=ticker,
+                risk_level="medium",
+                max_position_size=10.0,
+                stop_loss=10.0,
+                reasoning="Default risk assessment",
+            )
+        return factory
+
+    calls = []
+    for ticker in tickers:
+        prompt = ChatPromptValue(
+            messages=[
+                _RISK_SYSTEM,
+                _RISK_TICKER_SCHEMA_SYSTEM,
+                HumanMessage(
+                    content=_RISK_TICKER_HUMAN.format(
+                        ticker=ticker,
+                        signals=_dumps_pretty(aggregated_signals.get(ticker, [])),
+                        position=_dumps_pretty(positions.get(ticker, {})),
+                        cash=cash,
+                    )
+                ),
+            ]
+        )
+        calls.append(
+            acall_llm(
+                prompt=prompt,
+                pydantic_model=RiskAssessment,
+                agent_name=agent_id,
+                state=state,
+                default_factory=_default_for(ticker),
+            )
+        )
+
+    assessments = list(await asyncio.gather(*calls))
+
+    # Aggregate: overall risk is the median per-ticker severity, rounded up
+    severities = sorted(_RISK_SEVERITY[a.risk_level] for a in assessments) or [1]
+    overall = ("low", "medium", "high")[severities[len(severities) // 2]]
+    high_risk = [a.ticker for a in assessments if a.risk_level == "high"]
+    recommendations = (
+        f"Reduce or avoid exposure to high-risk names: {', '.join(high_risk)}."
+        if high_risk
+        else "Maintain diversified positions with appropriate stop losses."
+    )
+
+    return RiskManagerOutput(
+        assessments=assessments,
+        overall_risk=overall,
+        recommendations=recommendations,
+    )
+
+
+async def arisk_management_agent(state: AgentState, agent_id: str = "risk_management_agent"):
+    """Async variant of risk_management_agent with concurrent per-ticker calls."""
+    data = state["data"]
+    tickers = data["tickers"]
+    portfolio = data.get("portfolio", {})
+
+    progress.update_status(agent_id, None, "Analyzing risk exposure")
+
+    aggregated_signals = get_aggregated_signals(state)
+
+    positions = portfolio.get("positions", {})
+    cash = portfolio.get("cash", 100000)
+
+    progress.update_status(agent_id, None, "Generating risk assessment")
+
+    risk_output = await agenerate_risk_assessment(
+        tickers=tickers,
+        aggregated_signals=aggregated_signals,
+        positions=positions,
+        cash=cash,
+        state=state,
+        agent_id=agent_id,
+    )
+
+    envelope = RiskAssessmentEnvelope(
+        assessments={a.ticker: a for a in risk_output.assessments},
+        overall_risk=risk_output.overall_risk,
+        recommendations=risk_output.recommendations,
+    )
+
+    message = HumanMessage(content=envelope.model_dump_json(), name=agent_id)
+
+    risk_assessment = envelope.model_dump()
+
+    if state["metadata"]["show_reasoning"]:
+        queue_agent_reasoning(risk_assessment, agent_id)
+
+    state["data"]["risk_assessment"] = risk_assessment
+
+    progress.update_status(agent_id, None, "Done")
+
+    return {"messages": [message], "data": state["data"]}
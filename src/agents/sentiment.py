@@ -5,14 +5,30 @@ Replaces keyword-based sentiment with nuanced LLM analysis.
 Analyzes news articles to extract sentiment, key themes, and risk factors.
 """
 
+import asyncio
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import hashlib
 import logging
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
+import numpy as np
 from pydantic import BaseModel, Field
 
-from src.utils.llm import call_llm
+from src.utils.llm import acall_llm, call_llm
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_RESULT = {
+    "score": 0.0,
+    "confidence": 0,
+    "summary": "No news available for analysis",
+    "key_themes": [],
+    "risks_mentioned": [],
+    "catalysts_mentioned": [],
+    "articles_analyzed": 0,
+}
+
 
 class SentimentAnalysis(BaseModel):
     """Structured output for sentiment analysis."""
@@ -24,6 +40,215 @@ class SentimentAnalysis(BaseModel):
     catalysts_mentioned: list[str] = Field(description="Positive catalysts or opportunities mentioned")
 
 
+class TickerSentimentAnalysis(SentimentAnalysis):
+    """Sentiment analysis for one ticker within a batched response."""
+    ticker: str = Field(description="Stock ticker symbol this analysis refers to")
+
+
+class BatchSentimentAnalysis(BaseModel):
+    """Structured output for a batch of per-ticker sentiment analyses."""
+    results: list[TickerSentimentAnalysis]
+
+
+# Rough character budget per ticker's article block (~2000 tokens at the
+# usual ~4 chars/token). Bounds prompt cost instead of a fixed article count.
+_ARTICLE_CHAR_BUDGET = 8000
+
+
+def _select_articles(news_articles: list[dict]) -> list[dict]:
+    """Deduplicate by title and keep the newest articles within the budget.
+
+    Newswires syndicate the same headline across outlets; hashing the
+    lowercased title drops those repeats before they cost tokens. Articles
+    are taken newest-first until the character budget is exhausted.
+    """
+    seen: set[bytes] = set()
+    selected = []
+    budget = _ARTICLE_CHAR_BUDGET
+    newest_first = sorted(
+        news_articles,
+        key=lambda a: a.get("date", a.get("published", "")) or "",
+        reverse=True,
+    )
+    for article in newest_first:
+        title = article.get("title", "")
+        digest = hashlib.blake2b(title.lower().encode(), digest_size=8).digest()
+        if digest in seen:
+            continue
+        seen.add(digest)
+        cost = len(title) + len(article.get("summary", article.get("text", ""))[:500])
+        if cost > budget:
+            break
+        budget -= cost
+        selected.append(article)
+    return selected
+
+
+def _format_articles(news_articles: list[dict]) -> str:
+    """Format deduplicated, budget-capped articles as a numbered block."""
+    formatted_articles = []
+    for i, article in enumerate(_select_articles(news_articles), 1):
+        title = article.get("title", "")
+        summary = article.get("summary", article.get("text", ""))[:500]
+        date = article.get("date", article.get("published", ""))
+        formatted_articles.append(f"{i}. [{date}] {title}\n   {summary}")
+    return "\n\n".join(formatted_articles)
+
+
+# Provider sentiment labels mapped onto [-1, 1] for the quantitative prior
+_LABEL_SCORES = {
+    "positive": 1.0,
+    "bullish": 1.0,
+    "negative": -1.0,
+    "bearish": -1.0,
+    "neutral": 0.0,
+}
+
+
+def weighted_sentiment(scores, ages_days, half_life: float = 30.0) -> tuple[float, float]:
+    """Exponentially time-decayed mean and variance of per-article scores.
+
+    Vectorized NumPy over float64 arrays; newer articles dominate via
+    2**(-age/half_life) weights. Returns (0.0, 0.0) for empty input.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return 0.0, 0.0
+    weights = np.exp2(-np.asarray(ages_days, dtype=np.float64) / half_life)
+    total = weights.sum()
+    mean = float((weights * scores).sum() / total)
+    var = float((weights * (scores - mean) ** 2).sum() / total)
+    return mean, var
+
+
+def _sentiment_prior(news_articles: list[dict]) -> str:
+    """Deterministic decayed-sentiment summary line from provider labels.
+
+    When articles carry a pre-labelled sentiment, aggregate it numerically
+    here instead of making the LLM re-infer it from raw text; the line is
+    appended to the prompt as a prior. Empty when no labels are present.
+    """
+    scores = []
+    ages = []
+    dates = [a.get("date", a.get("published", "")) or "" for a in news_articles]
+    newest = max(dates, default="")[:10]
+    for article, date in zip(news_articles, dates):
+        label = str(article.get("sentiment", "")).lower()
+        if label not in _LABEL_SCORES:
+            continue
+        scores.append(_LABEL_SCORES[label])
+        try:
+            age = (datetime.fromisoformat(newest) - datetime.fromisoformat(date[:10])).days
+        except ValueError:
+            age = 0.0
+        ages.append(max(age, 0.0))
+    if not scores:
+        return ""
+    mean, var = weighted_sentiment(scores, ages)
+    return (
+        f"\nPre-computed signal from {len(scores)} labelled articles "
+        f"(time-decayed): mean sentiment {mean:+.2f}, variance {var:.2f}."
+    )
+
+
+def _build_batch_prompt(items: list[dict]) -> str:
+    """Build one prompt covering several tickers' news under numbered headers."""
+    sections = []
+    for i, item in enumerate(items, 1):
+        sections.append(
+            f"### {i}. {item['company_name']} ({item['ticker']})\n"
+            f"{_format_articles(item['news_articles'])}"
+            f"{_sentiment_prior(item['news_articles'])}"
+        )
+    return f"""Analyze the news sentiment for each of the companies below.
+
+For EVERY company, provide:
+1. Overall sentiment score from -1.0 (very negative) to +1.0 (very positive)
+2. Confidence level in your assessment (0-100)
+3. Brief summary of the overall sentiment
+4. Key themes emerging from the news
+5. Any risks or concerns mentioned
+6. Positive catalysts or opportunities mentioned
+
+{chr(10).join(sections)}
+
+Respond in JSON format matching the BatchSentimentAnalysis schema: one entry
+per company in "results", each including its "ticker"."""
+
+
+def _to_result(analysis: SentimentAnalysis, articles_analyzed: int) -> dict:
+    return {
+        "score": analysis.score,
+        "confidence": analysis.confidence,
+        "summary": analysis.summary,
+        "key_themes": analysis.key_themes,
+        "risks_mentioned": analysis.risks_mentioned,
+        "catalysts_mentioned": analysis.catalysts_mentioned,
+        "articles_analyzed": articles_analyzed,
+    }
+
+
+def _chunked(items: list[dict], size: int) -> Iterator[list[dict]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+async def analyze_sentiment_batch(
+    items: list[dict],
+    state: Optional[dict] = None,
+    batch_size: int = 10,
+) -> dict[str, dict]:
+    """
+    Analyze sentiment for many tickers with batched, concurrent LLM calls.
+
+    Packing batch_size tickers into each request amortizes the per-call
+    round-trip, and the chunks run concurrently via asyncio.gather — a
+    500-ticker scan becomes ~50 overlapped calls instead of 500 serial ones.
+
+    Args:
+        items: List of dicts with 'ticker', 'company_name', 'news_articles'
+        state: Optional agent state for LLM configuration
+        batch_size: Number of tickers per LLM call
+
+    Returns:
+        Dict mapping ticker to its sentiment analysis result
+    """
+    results: dict[str, dict] = {}
+    with_news = []
+    for item in items:
+        if item.get("news_articles"):
+            with_news.append(item)
+        else:
+            results[item["ticker"]] = dict(_EMPTY_RESULT)
+
+    async def _analyze_chunk(chunk: list[dict]) -> dict[str, dict]:
+        articles_by_ticker = {item["ticker"]: len(_select_articles(item["news_articles"])) for item in chunk}
+        try:
+            batch = await acall_llm(
+                prompt=_build_batch_prompt(chunk),
+                pydantic_model=BatchSentimentAnalysis,
+                agent_name="sentiment_analyzer",
+                state=state,
+            )
+            return {
+                analysis.ticker: _to_result(analysis, articles_by_ticker.get(analysis.ticker, 0))
+                for analysis in batch.results
+            }
+        except Exception as e:
+            logger.error(f"Error in batched sentiment analysis: {e}")
+            return {}
+
+    for chunk_results in await asyncio.gather(*(_analyze_chunk(c) for c in _chunked(with_news, batch_size))):
+        results.update(chunk_results)
+
+    # Tickers the LLM dropped from a batch fall back to the empty result
+    for item in with_news:
+        results.setdefault(item["ticker"], dict(_EMPTY_RESULT))
+
+    return results
+
+
 def analyze_sentiment(
     ticker: str,
     company_name: str,
@@ -33,6 +258,9 @@ def analyze_sentiment(
     """
     Analyze sentiment from news articles using LLM.
 
+    Single-ticker entry point; scans over many tickers should prefer
+    analyze_sentiment_batch.
+
     Args:
         ticker: Stock ticker symbol
         company_name: Company name for context
@@ -42,29 +270,11 @@ def analyze_sentiment(
     Returns:
         Dict with sentiment analysis results
     """
-    result = {
-        "score": 0.0,
-        "confidence": 0,
-        "summary": "No news available for analysis",
-        "key_themes": [],
-        "risks_mentioned": [],
-        "catalysts_mentioned": [],
-        "articles_analyzed": 0,
-    }
+    result = dict(_EMPTY_RESULT)
 
     if not news_articles:
         return result
 
-    # Format articles for prompt
-    formatted_articles = []
-    for i, article in enumerate(news_articles[:10], 1):  # Limit to 10 articles
-        title = article.get("title", "")
-        summary = article.get("summary", article.get("text", ""))[:500]
-        date = article.get("date", article.get("published", ""))
-        formatted_articles.append(f"{i}. [{date}] {title}\n   {summary}")
-
-    articles_text = "\n\n".join(formatted_articles)
-
     prompt = f"""Analyze the sentiment of the following news articles about {company_name} ({ticker}).
 
 Provide a comprehensive sentiment analysis including:
@@ -76,7 +286,7 @@ Provide a comprehensive sentiment analysis including:
 6. Positive catalysts or opportunities mentioned
 
 NEWS ARTICLES:
-{articles_text}
+{_format_articles(news_articles)}{_sentiment_prior(news_articles)}
 
 Respond in JSON format matching the SentimentAnalysis schema."""
 
@@ -88,15 +298,7 @@ Respond in JSON format matching the SentimentAnalysis schema."""
             state=state,
         )
 
-        result = {
-            "score": analysis.score,
-            "confidence": analysis.confidence,
-            "summary": analysis.summary,
-            "key_themes": analysis.key_themes,
-            "risks_mentioned": analysis.risks_mentioned,
-            "catalysts_mentioned": analysis.catalysts_mentioned,
-            "articles_analyzed": len(news_articles[:10]),
-        }
+        result = _to_result(analysis, len(_select_articles(news_articles)))
 
     except Exception as e:
         logger.error(f"Error in sentiment analysis for {ticker}: {e}")
@@ -105,15 +307,16 @@ Respond in JSON format matching the SentimentAnalysis schema."""
     return result
 
 
+# Label thresholds as a sorted table: bisect turns the branch chain into one
+# predictable lookup, which matters when rendering scan results for many
+# tickers with mixed scores.
+_SENTIMENT_THRESHOLDS = (-0.5, -0.2, 0.2, 0.5)
+_SENTIMENT_LABELS = ("very_negative", "negative", "neutral", "positive", "very_positive")
+
+
 def get_sentiment_label(score: float) -> str:
     """Convert sentiment score to human-readable label."""
-    if score >= 0.5:
-        return "very_positive"
-    elif score >= 0.2:
-        return "positive"
-    elif score > -0.2:
-        return "neutral"
-    elif score > -0.5:
-        return "negative"
-    else:
-        return "very_negative"
+    # Boundary ownership is asymmetric: 0.2/0.5 belong to the upper label
+    # (bisect_right), -0.2/-0.5 to the lower one (bisect_left).
+    i = bisect_left(_SENTIMENT_THRESHOLDS, score) if score < 0 else bisect_right(_SENTIMENT_THRESHOLDS, score)
+    return _SENTIMENT_LABELS[i]
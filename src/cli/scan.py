@@ -12,31 +12,30 @@ Usage:
 import argparse
 import asyncio
 import json
+
+try:
+    import orjson
+
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str).decode()
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from colorama import Fore, Style, init
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-
-from src.services.scanner import (
-    Scanner,
-    ScanConfig,
-    ScanResult,
-    load_universe_config,
-    load_scanner_config,
-    get_universe_tickers,
-    get_sector_tickers,
-    save_scan_result,
-    DEFAULT_ANALYSTS,
-)
-from src.utils.analysts import ANALYST_CONFIG
-
-# Initialize colorama
-init(autoreset=True)
+
+if TYPE_CHECKING:
+    from src.services.scanner import ScanResult
+
+# The scanner stack (and src.utils.analysts, which imports every agent and
+# transitively LangChain) is deferred to the code paths that actually scan,
+# so --help / --list-analysts / --list-universes don't pay its import cost.
 
 # Rich console for pretty output
 console = Console()
@@ -44,6 +43,8 @@ console = Console()
 
 def get_analyst_preset(preset_name: str, scanner_config: dict) -> list[str]:
     """Get list of analysts for a preset configuration."""
+    from src.services.scanner import DEFAULT_ANALYSTS
+
     analysts_config = scanner_config.get("analysts", {})
     return analysts_config.get(preset_name, DEFAULT_ANALYSTS)
 
@@ -62,7 +63,13 @@ def parse_analysts(analysts_str: str) -> list[str]:
     return [a.strip().lower() for a in analysts_str.split(",") if a.strip()]
 
 
-def display_results_table(result: ScanResult):
+# Style lookups for display_results_table, resolved once instead of via
+# inline ternaries on every row.
+_SIGNAL_STYLES = {"bullish": "green"}
+_DEFAULT_SIGNAL_STYLE = "red"
+
+
+def display_results_table(result: "ScanResult"):
     """Display scan results in a rich table."""
     table = Table(title=f"Scan Results - {result.universe_name}")
 
@@ -76,11 +83,17 @@ def display_results_table(result: ScanResult):
 
     for memo in result.high_conviction_memos:
         signal = memo.get("signal", "")
-        signal_style = "green" if signal == "bullish" else "red"
+        signal_style = _SIGNAL_STYLES.get(signal, _DEFAULT_SIGNAL_STYLE)
 
         conviction = memo.get("conviction", 0)
         conviction_style = "green bold" if conviction >= 80 else "yellow"
 
+        # Bind the thesis once; the previous one-liner called memo.get three
+        # times per row, which adds up on scans with hundreds of memos.
+        thesis = memo.get("thesis", "")
+        if len(thesis) > 50:
+            thesis = thesis[:50] + "..."
+
         table.add_row(
             memo.get("ticker", ""),
             memo.get("analyst", "")[:20],
@@ -88,13 +101,13 @@ def display_results_table(result: ScanResult):
             f"[{conviction_style}]{conviction}%[/{conviction_style}]",
             f"${memo.get('current_price', 0):.2f}",
             f"${memo.get('target_price', 0):.2f}",
-            memo.get("thesis", "")[:50] + "..." if len(memo.get("thesis", "")) > 50 else memo.get("thesis", ""),
+            thesis,
         )
 
     console.print(table)
 
 
-def display_summary(result: ScanResult):
+def display_summary(result: "ScanResult"):
     """Display scan summary."""
     duration = None
     if result.end_time and result.start_time:
@@ -123,6 +136,8 @@ def display_summary(result: ScanResult):
 
 def list_analysts():
     """List all available analysts."""
+    from src.utils.analysts import ANALYST_CONFIG
+
     table = Table(title="Available Analysts")
 
     table.add_column("Key", style="cyan")
@@ -161,6 +176,12 @@ def list_universes(universe_config: dict):
     console.print(table)
 
 
+def _write_result_file(filepath: str, payload: dict) -> None:
+    """Serialize and write a scan result; runs in a worker thread."""
+    with open(filepath, "w") as f:
+        f.write(_dumps_pretty(payload))
+
+
 async def run_scan_async(
     tickers: list[str],
     analysts: list[str],
@@ -170,9 +191,14 @@ async def run_scan_async(
     model_provider: str,
     save_results: bool,
     output_file: Optional[str],
-) -> ScanResult:
+    max_concurrency: int = 8,
+) -> "ScanResult":
     """Run the scan asynchronously."""
-    config = ScanConfig(conviction_threshold=conviction_threshold)
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+    from src.services.scanner import Scanner, ScanConfig, save_scan_result
+
+    config = ScanConfig(conviction_threshold=conviction_threshold, max_concurrency=max_concurrency)
 
     scanner = Scanner(
         config=config,
@@ -211,14 +237,14 @@ async def run_scan_async(
 
     display_summary(result)
 
-    # Save results
+    # Save results off the event loop: serializing and writing a multi-MB
+    # result would otherwise block any still-draining async work.
     if save_results:
         if output_file:
             filepath = output_file
-            with open(filepath, "w") as f:
-                json.dump(result.model_dump(), f, indent=2, default=str)
+            await asyncio.to_thread(_write_result_file, filepath, result.model_dump())
         else:
-            filepath = save_scan_result(result)
+            filepath = await asyncio.to_thread(save_scan_result, result)
         console.print(f"\n[green]Results saved to: {filepath}[/green]")
 
     return result
@@ -226,6 +252,15 @@ async def run_scan_async(
 
 def main():
     """Main entry point for the scan CLI."""
+    # uvloop roughly halves per-event loop overhead on Linux, which shows up
+    # once hundreds of LLM HTTP calls are in flight. Optional, like orjson.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description="Stock Scanner - Identify high-conviction investment opportunities",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -303,6 +338,12 @@ Examples:
         default="gpt-4.1",
         help="LLM model to use (default: gpt-4.1)",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum concurrent tickers in flight (default: 8, match provider rate limits)",
+    )
     parser.add_argument(
         "--provider",
         type=str,
@@ -346,6 +387,14 @@ Examples:
         list_analysts()
         return
 
+    from src.services.scanner import (
+        DEFAULT_ANALYSTS,
+        get_sector_tickers,
+        get_universe_tickers,
+        load_universe_config,
+    )
+    from src.utils.analysts import ANALYST_CONFIG
+
     universe_config = load_universe_config()
 
     if args.list_universes:
@@ -377,10 +426,9 @@ Examples:
     # Determine analysts to use
     scanner_config_data = {}
     try:
-        import yaml
+        from src.services.scanner import load_yaml_config
         config_path = Path(__file__).resolve().parent.parent.parent / "config" / "scanner.yaml"
-        with open(config_path) as f:
-            scanner_config_data = yaml.safe_load(f)
+        scanner_config_data = load_yaml_config(config_path)
     except Exception:
         pass
 
@@ -393,16 +441,21 @@ Examples:
     else:
         analysts = DEFAULT_ANALYSTS
 
-    # Validate analysts
-    valid_analysts = [a for a in analysts if a in ANALYST_CONFIG]
+    # Validate analysts: one pass partitions valid from invalid, with a
+    # frozenset of config keys instead of repeated dict/set construction.
+    analyst_keys = frozenset(ANALYST_CONFIG)
+    valid_analysts = []
+    invalid_analysts = []
+    for a in analysts:
+        (valid_analysts if a in analyst_keys else invalid_analysts).append(a)
+
     if not valid_analysts:
         console.print(f"[red]Error: No valid analysts specified[/red]")
         console.print(f"Available analysts: {', '.join(ANALYST_CONFIG.keys())}")
         sys.exit(1)
 
-    if len(valid_analysts) != len(analysts):
-        invalid = set(analysts) - set(valid_analysts)
-        console.print(f"[yellow]Warning: Ignoring invalid analysts: {', '.join(invalid)}[/yellow]")
+    if invalid_analysts:
+        console.print(f"[yellow]Warning: Ignoring invalid analysts: {', '.join(invalid_analysts)}[/yellow]")
 
     # Run the scan
     try:
@@ -415,11 +468,12 @@ Examples:
             model_provider=args.provider,
             save_results=not args.no_save,
             output_file=args.output,
+            max_concurrency=args.max_concurrency,
         ))
 
         # JSON output if requested
         if args.json:
-            print(json.dumps(result.model_dump(), indent=2, default=str))
+            print(_dumps_pretty(result.model_dump()))
 
         # Exit with error code if scan failed
         if result.status == "failed":
@@ -0,0 +1,94 @@
+"""
+Persistent disk cache with per-entry TTL for API responses.
+
+Backs the Fiscal.ai client: statements change quarterly at most, so warm
+reads come back from local files in microseconds instead of re-spending
+API quota and ~100 ms of latency per call. Entries are plain JSON files
+named by key hash; writes go through a temp file + os.replace so readers
+never see a partial entry.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Optional
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ai-hedge-fund", "api_cache")
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from request components."""
+    raw = "|".join(repr(p) for p in parts)
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+class DiskCache:
+    """File-per-entry JSON cache with TTL expiry."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.getenv("AI_HEDGE_FUND_CACHE_DIR", _DEFAULT_CACHE_DIR)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() > entry.get("expires", 0):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps({"expires": time.time() + ttl, "value": value}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Failed to write cache entry {key}: {e}")
+
+
+_disk_cache: Optional[DiskCache] = None
+
+
+def get_disk_cache() -> DiskCache:
+    """Get the global disk cache instance."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = DiskCache()
+    return _disk_cache
@@ -5,15 +5,87 @@ This client provides access to financial data from Fiscal.ai's API,
 including financial statements, ratios, business segments, and pricing data.
 """
 
+import asyncio
 import os
+import threading
 import httpx
 import logging
 from typing import Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+
+from src.data._cache import get_disk_cache, make_key
+
 logger = logging.getLogger(__name__)
 
+# Concurrent requests allowed per batch call; bounds gather fan-out so large
+# universes don't exhaust the connection pool or trip API rate limits.
+_BATCH_CONCURRENCY = 16
+
+# Per-endpoint cache TTLs, matched by path prefix. Statements and segments
+# change quarterly, ratios and profiles daily, quotes continuously.
+_ENDPOINT_TTLS = (
+    ("/financials", 90 * 86400),
+    ("/income-statement", 90 * 86400),
+    ("/balance-sheet", 90 * 86400),
+    ("/cash-flow", 90 * 86400),
+    ("/key-metrics", 90 * 86400),
+    ("/segments", 90 * 86400),
+    ("/ratios", 86400),
+    ("/profile", 86400),
+    ("/enterprise-value", 86400),
+    ("/quote", 60),
+)
+
+
+def _ttl_for(endpoint: str) -> Optional[float]:
+    """TTL in seconds for a cacheable endpoint, or None to skip caching."""
+    for prefix, ttl in _ENDPOINT_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return None
+
+
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """Run a coroutine while holding a semaphore slot."""
+    async with sem:
+        return await coro
+
+
+# HTTP/2 multiplexes concurrent requests over one TLS connection but needs
+# the optional h2 package; fall back to HTTP/1.1 keep-alive without it.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Pool sized for the batch fan-out: defaults (10 keepalive / 100 max) force
+# connection churn once concurrent batches stack up.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=128,
+    keepalive_expiry=60.0,
+)
+
+# Transient statuses worth retrying with backoff; anything else fails fast
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 4
+
 
 class FinancialStatement(BaseModel):
     """Financial statement data model."""
@@ -49,7 +121,10 @@ class FinancialStatement(BaseModel):
     free_cash_flow: Optional[float] = None
     dividends_paid: Optional[float] = None
 
-    model_config = {"extra": "allow"}
+    # Known fields only: "allow" forces dynamic-extra plumbing and a
+    # dict-heavy layout; ignoring unknowns keeps instances lean, and
+    # frozen makes the parsed statements safely shareable across tasks
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class FinancialRatios(BaseModel):
@@ -93,7 +168,10 @@ class FinancialRatios(BaseModel):
     earnings_growth: Optional[float] = None
     fcf_growth: Optional[float] = None
 
-    model_config = {"extra": "allow"}
+    # Known fields only: "allow" forces dynamic-extra plumbing and a
+    # dict-heavy layout; ignoring unknowns keeps instances lean, and
+    # frozen makes the parsed statements safely shareable across tasks
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class BusinessSegment(BaseModel):
@@ -104,7 +182,10 @@ class BusinessSegment(BaseModel):
     revenue_percentage: Optional[float] = None
     growth_rate: Optional[float] = None
 
-    model_config = {"extra": "allow"}
+    # Known fields only: "allow" forces dynamic-extra plumbing and a
+    # dict-heavy layout; ignoring unknowns keeps instances lean, and
+    # frozen makes the parsed statements safely shareable across tasks
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class SegmentData(BaseModel):
@@ -115,7 +196,10 @@ class SegmentData(BaseModel):
     geographic_segments: list[BusinessSegment] = []
     kpis: dict[str, Any] = {}
 
-    model_config = {"extra": "allow"}
+    # Known fields only: "allow" forces dynamic-extra plumbing and a
+    # dict-heavy layout; ignoring unknowns keeps instances lean, and
+    # frozen makes the parsed statements safely shareable across tasks
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class FiscalClient:
@@ -141,6 +225,10 @@ class FiscalClient:
             logger.warning("No FISCAL_API_KEY provided. Some API calls may fail.")
 
         self._client: Optional[httpx.AsyncClient] = None
+        # Hard cap on in-flight requests to the Fiscal host, independent of
+        # how wide callers fan out with gather; kept below the pool size so
+        # the semaphore, not connection exhaustion, is what queues work
+        self._sem = asyncio.Semaphore(int(os.getenv("FISCAL_MAX_CONCURRENCY", "32")))
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
@@ -155,6 +243,13 @@ class FiscalClient:
                 headers=headers,
                 timeout=30.0,
                 base_url=self.base_url,
+                # Connection-level retries cover TCP/TLS failures the
+                # status-code backoff in _make_request never sees
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    http2=_HTTP2,
+                    limits=_POOL_LIMITS,
+                ),
             )
         return self._client
 
@@ -163,6 +258,17 @@ class FiscalClient:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def warmup(self):
+        """Pre-open the connection pool so the first real call skips the
+        TCP/TLS handshake. Best-effort: failures only log at debug."""
+        if not self.api_key:
+            return
+        client = await self._get_client()
+        try:
+            await client.get("/health")
+        except Exception as e:
+            logger.debug("Fiscal warmup request failed: %s", e)
+
     async def _make_request(
         self,
         method: str,
@@ -182,23 +288,55 @@ class FiscalClient:
         Returns:
             Response data as dict
         """
+        # Warm GET paths are served from the persistent disk cache, keyed on
+        # the full request shape with a per-endpoint TTL
+        cache_key = None
+        ttl = _ttl_for(endpoint) if method == "GET" else None
+        if ttl is not None:
+            cache_key = make_key(method, self.base_url, endpoint, sorted((params or {}).items()))
+            cached = get_disk_cache().get(cache_key)
+            if cached is not None:
+                return cached
+
         client = await self._get_client()
 
-        try:
-            response = await client.request(
-                method=method,
-                url=endpoint,
-                params=params,
-                json=json_data,
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code} for {endpoint}: {e.response.text}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Request error for {endpoint}: {e}")
-            raise
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                # Hold a slot only for the request itself, not cache I/O or
+                # backoff sleeps
+                async with self._sem:
+                    response = await client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params,
+                        json=json_data,
+                    )
+                response.raise_for_status()
+                # Surfaces whether HTTP/2 multiplexing is actually in play
+                # (needs the optional h2 package) when debugging throughput
+                logger.debug("Fiscal %s %s via %s", method, endpoint, response.http_version)
+                # Parse the raw bytes with orjson when available: one pass in
+                # native code, noticeably faster than response.json() on the
+                # multi-kilobyte statement payloads.
+                data = _loads(response.content)
+                if cache_key is not None:
+                    get_disk_cache().set(cache_key, data, ttl)
+                return data
+            except httpx.HTTPStatusError as e:
+                # Back off and retry rate limits and transient 5xx, honoring
+                # any Retry-After the server sends
+                if e.response.status_code in _RETRY_STATUS_CODES and attempt < _MAX_RETRIES:
+                    try:
+                        retry_after = float(e.response.headers.get("Retry-After", 0))
+                    except ValueError:
+                        retry_after = 0.0
+                    await asyncio.sleep(min(2**attempt, 30) + retry_after)
+                    continue
+                logger.error("HTTP error %s for %s: %s", e.response.status_code, endpoint, e.response.text)
+                raise
+            except httpx.RequestError as e:
+                logger.error("Request error for %s: %s", endpoint, e)
+                raise
 
     async def get_financials(
         self,
@@ -228,9 +366,11 @@ class FiscalClient:
             )
 
             statements = data.get("financials", [])
-            return [FinancialStatement(ticker=ticker, **stmt) for stmt in statements]
+            # Trusted server payload: model_construct skips per-field
+            # validation, which dominates construction cost at large limits
+            return [FinancialStatement.model_construct(ticker=ticker, **stmt) for stmt in statements]
         except Exception as e:
-            logger.error(f"Error fetching financials for {ticker}: {e}")
+            logger.error("Error fetching financials for %s: %s", ticker, e)
             return []
 
     async def get_income_statement(
@@ -261,7 +401,7 @@ class FiscalClient:
             )
             return data.get("income_statements", [])
         except Exception as e:
-            logger.error(f"Error fetching income statement for {ticker}: {e}")
+            logger.error("Error fetching income statement for %s: %s", ticker, e)
             return []
 
     async def get_balance_sheet(
@@ -292,7 +432,7 @@ class FiscalClient:
             )
             return data.get("balance_sheets", [])
         except Exception as e:
-            logger.error(f"Error fetching balance sheet for {ticker}: {e}")
+            logger.error("Error fetching balance sheet for %s: %s", ticker, e)
             return []
 
     async def get_cash_flow(
@@ -323,7 +463,7 @@ class FiscalClient:
             )
             return data.get("cash_flows", [])
         except Exception as e:
-            logger.error(f"Error fetching cash flow for {ticker}: {e}")
+            logger.error("Error fetching cash flow for %s: %s", ticker, e)
             return []
 
     async def get_ratios(self, ticker: str) -> Optional[FinancialRatios]:
@@ -344,10 +484,11 @@ class FiscalClient:
 
             ratios_data = data.get("ratios", {})
             if ratios_data:
-                return FinancialRatios(ticker=ticker, **ratios_data)
+                # Trusted server payload; skip validation (see get_financials)
+                return FinancialRatios.model_construct(ticker=ticker, **ratios_data)
             return None
         except Exception as e:
-            logger.error(f"Error fetching ratios for {ticker}: {e}")
+            logger.error("Error fetching ratios for %s: %s", ticker, e)
             return None
 
     async def get_key_metrics(
@@ -378,7 +519,7 @@ class FiscalClient:
             )
             return data.get("metrics", [])
         except Exception as e:
-            logger.error(f"Error fetching key metrics for {ticker}: {e}")
+            logger.error("Error fetching key metrics for %s: %s", ticker, e)
             return []
 
     async def get_segments(self, ticker: str) -> Optional[SegmentData]:
@@ -401,8 +542,9 @@ class FiscalClient:
             geo_segments_list = data.get("geographic_segments", [])
             kpis = data.get("kpis", {})
 
-            segments = [BusinessSegment(**seg) for seg in segments_list]
-            geo_segments = [BusinessSegment(**seg) for seg in geo_segments_list]
+            # Trusted server payload; skip validation (see get_financials)
+            segments = [BusinessSegment.model_construct(**seg) for seg in segments_list]
+            geo_segments = [BusinessSegment.model_construct(**seg) for seg in geo_segments_list]
 
             return SegmentData(
                 ticker=ticker,
@@ -412,7 +554,7 @@ class FiscalClient:
                 kpis=kpis,
             )
         except Exception as e:
-            logger.error(f"Error fetching segments for {ticker}: {e}")
+            logger.error("Error fetching segments for %s: %s", ticker, e)
             return None
 
     async def get_company_profile(self, ticker: str) -> Optional[dict]:
@@ -432,7 +574,7 @@ class FiscalClient:
             )
             return data.get("profile", {})
         except Exception as e:
-            logger.error(f"Error fetching company profile for {ticker}: {e}")
+            logger.error("Error fetching company profile for %s: %s", ticker, e)
             return None
 
     async def get_price(self, ticker: str) -> Optional[float]:
@@ -448,24 +590,28 @@ class FiscalClient:
         Returns:
             Current stock price or None if not available
         """
-        try:
-            data = await self._make_request(
-                method="GET",
-                endpoint=f"/quote/{ticker}",
-            )
-
-            price = data.get("price") or data.get("current_price") or data.get("last_price")
-            if price:
-                return float(price)
-        except Exception as e:
-            logger.warning(f"Fiscal.ai price fetch failed for {ticker}: {e}")
+        # Without an API key the Fiscal request reliably 401s after a full
+        # round-trip; skip straight to the fallback.
+        if self.api_key:
+            try:
+                data = await self._make_request(
+                    method="GET",
+                    endpoint=f"/quote/{ticker}",
+                )
+
+                price = data.get("price") or data.get("current_price") or data.get("last_price")
+                if price:
+                    return float(price)
+            except Exception as e:
+                logger.warning("Fiscal.ai price fetch failed for %s: %s", ticker, e)
 
-        # Fallback to yfinance
+        # Fallback to yfinance, in a worker thread: the sync HTTP call would
+        # otherwise block the event loop and serialize concurrent batch work.
         try:
             from src.data.yfinance_client import get_current_price
-            return get_current_price(ticker)
+            return await asyncio.to_thread(get_current_price, ticker)
         except Exception as e:
-            logger.error(f"yfinance fallback failed for {ticker}: {e}")
+            logger.error("yfinance fallback failed for %s: %s", ticker, e)
             return None
 
     async def get_market_cap(self, ticker: str) -> Optional[float]:
@@ -478,24 +624,26 @@ class FiscalClient:
         Returns:
             Market cap or None if not available
         """
-        try:
-            data = await self._make_request(
-                method="GET",
-                endpoint=f"/quote/{ticker}",
-            )
-
-            market_cap = data.get("market_cap") or data.get("marketCap")
-            if market_cap:
-                return float(market_cap)
-        except Exception as e:
-            logger.warning(f"Fiscal.ai market cap fetch failed for {ticker}: {e}")
+        # Skip the doomed Fiscal attempt without an API key (see get_price)
+        if self.api_key:
+            try:
+                data = await self._make_request(
+                    method="GET",
+                    endpoint=f"/quote/{ticker}",
+                )
+
+                market_cap = data.get("market_cap") or data.get("marketCap")
+                if market_cap:
+                    return float(market_cap)
+            except Exception as e:
+                logger.warning("Fiscal.ai market cap fetch failed for %s: %s", ticker, e)
 
-        # Fallback to yfinance
+        # Fallback to yfinance, in a worker thread (see get_price)
         try:
             from src.data.yfinance_client import get_market_cap
-            return get_market_cap(ticker)
+            return await asyncio.to_thread(get_market_cap, ticker)
         except Exception as e:
-            logger.error(f"yfinance market cap fallback failed for {ticker}: {e}")
+            logger.error("yfinance market cap fallback failed for %s: %s", ticker, e)
             return None
 
     async def get_enterprise_value(self, ticker: str) -> Optional[float]:
@@ -508,6 +656,9 @@ class FiscalClient:
         Returns:
             Enterprise value or None if not available
         """
+        # No yfinance fallback here; skip the doomed request without a key
+        if not self.api_key:
+            return None
         try:
             data = await self._make_request(
                 method="GET",
@@ -515,7 +666,7 @@ class FiscalClient:
             )
             return data.get("enterprise_value")
         except Exception as e:
-            logger.error(f"Error fetching enterprise value for {ticker}: {e}")
+            logger.error("Error fetching enterprise value for %s: %s", ticker, e)
             return None
 
     async def search_tickers(self, query: str, limit: int = 10) -> list[dict]:
@@ -540,7 +691,7 @@ class FiscalClient:
             )
             return data.get("results", [])
         except Exception as e:
-            logger.error(f"Error searching tickers for '{query}': {e}")
+            logger.error("Error searching tickers for '%s': %s", query, e)
             return []
 
     async def batch_get_financials(
@@ -560,14 +711,19 @@ class FiscalClient:
         Returns:
             Dict mapping ticker to list of FinancialStatement objects
         """
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        outcomes = await asyncio.gather(
+            *(_bounded(sem, self.get_financials(t, period, limit)) for t in tickers),
+            return_exceptions=True,
+        )
+
         results = {}
-        for ticker in tickers:
-            try:
-                statements = await self.get_financials(ticker, period, limit)
-                results[ticker] = statements
-            except Exception as e:
-                logger.error(f"Error in batch fetch for {ticker}: {e}")
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error in batch fetch for %s: %s", ticker, outcome)
                 results[ticker] = []
+            else:
+                results[ticker] = outcome
         return results
 
     async def batch_get_ratios(
@@ -583,24 +739,35 @@ class FiscalClient:
         Returns:
             Dict mapping ticker to FinancialRatios object or None
         """
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        outcomes = await asyncio.gather(
+            *(_bounded(sem, self.get_ratios(t)) for t in tickers),
+            return_exceptions=True,
+        )
+
         results = {}
-        for ticker in tickers:
-            try:
-                ratios = await self.get_ratios(ticker)
-                results[ticker] = ratios
-            except Exception as e:
-                logger.error(f"Error in batch ratios fetch for {ticker}: {e}")
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Error in batch ratios fetch for %s: %s", ticker, outcome)
                 results[ticker] = None
+            else:
+                results[ticker] = outcome
         return results
 
 
 # Convenience function to get a singleton client
 _default_client: Optional[FiscalClient] = None
+_default_client_lock = threading.Lock()
 
 
 def get_fiscal_client() -> FiscalClient:
     """Get the default Fiscal.ai client instance."""
     global _default_client
     if _default_client is None:
-        _default_client = FiscalClient()
+        # Double-checked lock: concurrent first calls (threads or tasks
+        # yielding mid-construction) must not each build a client and leak
+        # the loser's connection pool
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = FiscalClient()
     return _default_client
@@ -6,9 +6,14 @@ as a reliable fallback for price information.
 """
 
 import logging
+import os
+import threading
+import time
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,40 @@ def _get_yf():
     return _yf
 
 
+@lru_cache(maxsize=512)
+def _ticker(symbol: str):
+    """Reuse one yf.Ticker per symbol so its session keep-alive state persists."""
+    return _get_yf().Ticker(symbol)
+
+
+# Ticker.info is an HTTP fetch plus a large JSON parse, and a multi-metric
+# pipeline asks for it several times per ticker. A short TTL keeps quotes
+# fresh while collapsing those repeats into one fetch per ticker per window.
+_INFO_TTL = 60.0
+_info_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _get_info(ticker: str) -> dict:
+    """Get Ticker.info, cached for _INFO_TTL seconds per ticker."""
+    now = time.time()
+    cached = _info_cache.get(ticker)
+    if cached is not None and now - cached[0] < _INFO_TTL:
+        return cached[1]
+
+    # Fresh Ticker per refetch: yfinance pins .info on the instance after the
+    # first access, so the lru-cached Ticker would serve the same dict forever
+    # and this TTL would never actually refresh anything.
+    info = _get_yf().Ticker(ticker).info or {}
+    _info_cache[ticker] = (now, info)
+    return info
+
+
+def clear_yf_caches() -> None:
+    """Reset the info and Ticker caches (used by tests)."""
+    _info_cache.clear()
+    _ticker.cache_clear()
+
+
 def get_current_price(ticker: str) -> Optional[float]:
     """
     Get the current stock price for a ticker.
@@ -37,9 +76,7 @@ def get_current_price(ticker: str) -> Optional[float]:
         Current stock price as float, or None if not available
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         # Try different price fields in order of preference
         price = (
@@ -53,15 +90,15 @@ def get_current_price(ticker: str) -> Optional[float]:
             return float(price)
 
         # Fallback: get the latest close from history
-        hist = stock.history(period="1d")
+        hist = _ticker(ticker).history(period="1d")
         if not hist.empty:
             return float(hist['Close'].iloc[-1])
 
-        logger.warning(f"No price data available for {ticker}")
+        logger.warning("No price data available for %s", ticker)
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching current price for {ticker}: {e}")
+        logger.error("Error fetching current price for %s: %s", ticker, e)
         return None
 
 
@@ -69,6 +106,7 @@ def get_price_history(
     ticker: str,
     period: str = "1y",
     interval: str = "1d",
+    columns: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     Get historical price data for a ticker.
@@ -77,23 +115,29 @@ def get_price_history(
         ticker: Stock ticker symbol
         period: Time period (e.g., '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
         interval: Data interval (e.g., '1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo')
+        columns: Optional subset of columns to keep (e.g. ['Close']); also
+            skips the dividend/split action columns, cutting peak memory on
+            long fine-grained histories
 
     Returns:
         DataFrame with columns: Open, High, Low, Close, Volume, Dividends, Stock Splits
+        (or just the requested subset when columns is given)
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period, interval=interval)
+        stock = _ticker(ticker)
+        if columns is not None:
+            hist = stock.history(period=period, interval=interval, actions=False)[columns]
+        else:
+            hist = stock.history(period=period, interval=interval)
 
         if hist.empty:
-            logger.warning(f"No historical data available for {ticker}")
+            logger.warning("No historical data available for %s", ticker)
             return pd.DataFrame()
 
         return hist
 
     except Exception as e:
-        logger.error(f"Error fetching price history for {ticker}: {e}")
+        logger.error("Error fetching price history for %s: %s", ticker, e)
         return pd.DataFrame()
 
 
@@ -116,18 +160,17 @@ def get_price_history_range(
         DataFrame with price data
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         hist = stock.history(start=start_date, end=end_date, interval=interval)
 
         if hist.empty:
-            logger.warning(f"No historical data for {ticker} from {start_date} to {end_date}")
+            logger.warning("No historical data for %s from %s to %s", ticker, start_date, end_date)
             return pd.DataFrame()
 
         return hist
 
     except Exception as e:
-        logger.error(f"Error fetching price history range for {ticker}: {e}")
+        logger.error("Error fetching price history range for %s: %s", ticker, e)
         return pd.DataFrame()
 
 
@@ -142,19 +185,17 @@ def get_market_cap(ticker: str) -> Optional[float]:
         Market cap as float, or None if not available
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         market_cap = info.get('marketCap')
         if market_cap is not None:
             return float(market_cap)
 
-        logger.warning(f"No market cap data available for {ticker}")
+        logger.warning("No market cap data available for %s", ticker)
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching market cap for {ticker}: {e}")
+        logger.error("Error fetching market cap for %s: %s", ticker, e)
         return None
 
 
@@ -169,12 +210,10 @@ def get_stock_info(ticker: str) -> dict:
         Dict containing stock info (sector, industry, employees, etc.)
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        return stock.info
+        return _get_info(ticker)
 
     except Exception as e:
-        logger.error(f"Error fetching stock info for {ticker}: {e}")
+        logger.error("Error fetching stock info for %s: %s", ticker, e)
         return {}
 
 
@@ -190,30 +229,24 @@ def get_price_change(ticker: str, days: int = 1) -> Optional[float]:
         Price change as decimal (e.g., 0.05 for 5% increase)
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-
-        # Fetch a bit more data to ensure we have enough
-        period = f"{days + 5}d"
-        hist = stock.history(period=period)
-
-        if len(hist) < 2:
-            logger.warning(f"Insufficient data for {ticker} price change calculation")
+        # Fetch a bit more data to ensure we have enough; only Close is used
+        hist = get_price_history(ticker, period=f"{days + 5}d", columns=['Close'])
+        if hist.empty:
+            logger.warning("Insufficient data for %s price change calculation", ticker)
             return None
 
-        # Get the price from 'days' ago and current
-        if len(hist) > days:
-            old_price = float(hist['Close'].iloc[-(days + 1)])
-            current_price = float(hist['Close'].iloc[-1])
-            return (current_price - old_price) / old_price
+        closes = hist['Close'].to_numpy(dtype=np.float64)
+        if closes.size < 2:
+            logger.warning("Insufficient data for %s price change calculation", ticker)
+            return None
 
-        # If we don't have enough history, use what we have
-        old_price = float(hist['Close'].iloc[0])
-        current_price = float(hist['Close'].iloc[-1])
-        return (current_price - old_price) / old_price
+        # Index the numpy view directly; use the oldest close when the
+        # history is shorter than the requested lookback
+        old_price = closes[-(days + 1)] if closes.size > days else closes[0]
+        return float((closes[-1] - old_price) / old_price)
 
     except Exception as e:
-        logger.error(f"Error calculating price change for {ticker}: {e}")
+        logger.error("Error calculating price change for %s: %s", ticker, e)
         return None
 
 
@@ -229,21 +262,20 @@ def get_volatility(ticker: str, period: str = "1y") -> Optional[float]:
         Annualized volatility as decimal
     """
     try:
-        hist = get_price_history(ticker, period=period)
+        hist = get_price_history(ticker, period=period, columns=['Close'])
         if hist.empty or len(hist) < 20:
             return None
 
-        # Calculate daily returns
-        returns = hist['Close'].pct_change().dropna()
+        # Daily returns on the raw numpy array: pandas pct_change builds a
+        # new Series plus alignment machinery for a handful of float ops
+        closes = hist['Close'].to_numpy(dtype=np.float64)
+        returns = np.diff(closes) / closes[:-1]
 
         # Annualize the standard deviation (assuming ~252 trading days)
-        daily_vol = returns.std()
-        annual_vol = daily_vol * (252 ** 0.5)
-
-        return float(annual_vol)
+        return float(returns.std(ddof=1) * np.sqrt(252))
 
     except Exception as e:
-        logger.error(f"Error calculating volatility for {ticker}: {e}")
+        logger.error("Error calculating volatility for %s: %s", ticker, e)
         return None
 
 
@@ -258,9 +290,7 @@ def get_dividend_yield(ticker: str) -> Optional[float]:
         Dividend yield as decimal (e.g., 0.025 for 2.5%)
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         div_yield = info.get('dividendYield') or info.get('trailingAnnualDividendYield')
         if div_yield is not None:
@@ -269,7 +299,7 @@ def get_dividend_yield(ticker: str) -> Optional[float]:
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching dividend yield for {ticker}: {e}")
+        logger.error("Error fetching dividend yield for %s: %s", ticker, e)
         return None
 
 
@@ -284,9 +314,7 @@ def get_pe_ratio(ticker: str) -> Optional[float]:
         P/E ratio as float, or None if not available
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         pe = info.get('trailingPE') or info.get('forwardPE')
         if pe is not None:
@@ -295,7 +323,7 @@ def get_pe_ratio(ticker: str) -> Optional[float]:
         return None
 
     except Exception as e:
-        logger.error(f"Error fetching P/E ratio for {ticker}: {e}")
+        logger.error("Error fetching P/E ratio for %s: %s", ticker, e)
         return None
 
 
@@ -310,9 +338,7 @@ def get_52_week_range(ticker: str) -> tuple[Optional[float], Optional[float]]:
         Tuple of (52_week_low, 52_week_high)
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = _get_info(ticker)
 
         low = info.get('fiftyTwoWeekLow')
         high = info.get('fiftyTwoWeekHigh')
@@ -323,10 +349,65 @@ def get_52_week_range(ticker: str) -> tuple[Optional[float], Optional[float]]:
         )
 
     except Exception as e:
-        logger.error(f"Error fetching 52-week range for {ticker}: {e}")
+        logger.error("Error fetching 52-week range for %s: %s", ticker, e)
         return (None, None)
 
 
+def get_quote_bundle(ticker: str) -> dict:
+    """
+    Get price, market cap, P/E, dividend yield and 52-week range together.
+
+    Callers that need several metrics should prefer this over the
+    single-metric helpers: everything is extracted from one Ticker.info
+    fetch instead of parsing the same payload once per metric.
+
+    Args:
+        ticker: Stock ticker symbol
+
+    Returns:
+        Dict with price, market_cap, pe, dividend_yield,
+        fifty_two_week_low, fifty_two_week_high (values None when missing)
+    """
+    bundle = {
+        "price": None,
+        "market_cap": None,
+        "pe": None,
+        "dividend_yield": None,
+        "fifty_two_week_low": None,
+        "fifty_two_week_high": None,
+    }
+
+    try:
+        info = _get_info(ticker)
+
+        price = (
+            info.get('currentPrice') or
+            info.get('regularMarketPrice') or
+            info.get('previousClose') or
+            info.get('open')
+        )
+        if price is not None:
+            bundle["price"] = float(price)
+
+        for key, *fields in (
+            ("market_cap", 'marketCap'),
+            ("pe", 'trailingPE', 'forwardPE'),
+            ("dividend_yield", 'dividendYield', 'trailingAnnualDividendYield'),
+            ("fifty_two_week_low", 'fiftyTwoWeekLow'),
+            ("fifty_two_week_high", 'fiftyTwoWeekHigh'),
+        ):
+            for field in fields:
+                value = info.get(field)
+                if value is not None:
+                    bundle[key] = float(value)
+                    break
+
+    except Exception as e:
+        logger.error("Error fetching quote bundle for %s: %s", ticker, e)
+
+    return bundle
+
+
 def batch_get_prices(tickers: list[str]) -> dict[str, Optional[float]]:
     """
     Get current prices for multiple tickers.
@@ -337,9 +418,33 @@ def batch_get_prices(tickers: list[str]) -> dict[str, Optional[float]]:
     Returns:
         Dict mapping ticker to price
     """
-    results = {}
-    for ticker in tickers:
-        results[ticker] = get_current_price(ticker)
+    if not tickers:
+        return {}
+    if len(tickers) == 1:
+        return {tickers[0]: get_current_price(tickers[0])}
+
+    # One multi-ticker download instead of N Ticker.info round-trips; any
+    # ticker missing from the frame falls back to the per-ticker path.
+    results: dict[str, Optional[float]] = {}
+    try:
+        yf = _get_yf()
+        df = yf.download(
+            " ".join(tickers),
+            period="1d",
+            progress=False,
+            threads=True,
+            group_by="ticker",
+        )
+        for ticker in tickers:
+            try:
+                closes = df[ticker]['Close'].dropna()
+                results[ticker] = float(closes.iloc[-1]) if not closes.empty else get_current_price(ticker)
+            except (KeyError, IndexError):
+                results[ticker] = get_current_price(ticker)
+    except Exception as e:
+        logger.error("Error in batch price download: %s", e)
+        for ticker in tickers:
+            results.setdefault(ticker, get_current_price(ticker))
     return results
 
 
@@ -354,9 +459,36 @@ def batch_get_price_changes(tickers: list[str], days: int = 1) -> dict[str, Opti
     Returns:
         Dict mapping ticker to price change percentage
     """
-    results = {}
-    for ticker in tickers:
-        results[ticker] = get_price_change(ticker, days)
+    if not tickers:
+        return {}
+    if len(tickers) == 1:
+        return {tickers[0]: get_price_change(tickers[0], days)}
+
+    # One multi-ticker history download covers every change calculation
+    results: dict[str, Optional[float]] = {}
+    try:
+        yf = _get_yf()
+        df = yf.download(
+            " ".join(tickers),
+            period=f"{days + 5}d",
+            progress=False,
+            threads=True,
+            group_by="ticker",
+        )
+        for ticker in tickers:
+            try:
+                closes = df[ticker]['Close'].dropna().to_numpy()
+                if closes.size < 2:
+                    results[ticker] = None
+                    continue
+                old = closes[-(days + 1)] if closes.size > days else closes[0]
+                results[ticker] = float((closes[-1] - old) / old)
+            except (KeyError, IndexError):
+                results[ticker] = get_price_change(ticker, days)
+    except Exception as e:
+        logger.error("Error in batch price change download: %s", e)
+        for ticker in tickers:
+            results.setdefault(ticker, get_price_change(ticker, days))
     return results
 
 
@@ -368,17 +500,14 @@ def is_market_open() -> bool:
         True if market is open, False otherwise
     """
     try:
-        yf = _get_yf()
-
         # Get SPY as a proxy for market status
-        spy = yf.Ticker("SPY")
-        info = spy.info
+        info = _get_info("SPY")
 
         market_state = info.get('marketState', '')
         return market_state.upper() in ['REGULAR', 'PRE', 'POST']
 
     except Exception as e:
-        logger.error(f"Error checking market status: {e}")
+        logger.error("Error checking market status: %s", e)
         return False
 
 
@@ -393,12 +522,11 @@ def get_earnings_dates(ticker: str) -> pd.DataFrame:
         DataFrame with earnings dates
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         return stock.earnings_dates
 
     except Exception as e:
-        logger.error(f"Error fetching earnings dates for {ticker}: {e}")
+        logger.error("Error fetching earnings dates for %s: %s", ticker, e)
         return pd.DataFrame()
 
 
@@ -413,12 +541,11 @@ def get_recommendations(ticker: str) -> pd.DataFrame:
         DataFrame with recommendation history
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         return stock.recommendations
 
     except Exception as e:
-        logger.error(f"Error fetching recommendations for {ticker}: {e}")
+        logger.error("Error fetching recommendations for %s: %s", ticker, e)
         return pd.DataFrame()
 
 
@@ -433,12 +560,11 @@ def get_institutional_holders(ticker: str) -> pd.DataFrame:
         DataFrame with institutional holders
     """
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         return stock.institutional_holders
 
     except Exception as e:
-        logger.error(f"Error fetching institutional holders for {ticker}: {e}")
+        logger.error("Error fetching institutional holders for %s: %s", ticker, e)
         return pd.DataFrame()
 
 
@@ -463,8 +589,7 @@ def get_upcoming_catalysts(ticker: str) -> dict:
     }
 
     try:
-        yf = _get_yf()
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
 
         # Get earnings dates
         earnings = stock.earnings_dates
@@ -481,7 +606,7 @@ def get_upcoming_catalysts(ticker: str) -> dict:
                     catalysts["earnings_confirmed"] = pd.notna(future_earnings.iloc[0]["EPS Estimate"])
 
         # Get dividend info
-        info = stock.info
+        info = _get_info(ticker)
         if info:
             ex_div = info.get("exDividendDate")
             if ex_div:
@@ -495,6 +620,21 @@ def get_upcoming_catalysts(ticker: str) -> dict:
                 catalysts["dividend_yield"] = round(div_yield * 100, 2)  # As percentage
 
     except Exception as e:
-        logger.error(f"Error fetching catalysts for {ticker}: {e}")
+        logger.error("Error fetching catalysts for %s: %s", ticker, e)
 
     return catalysts
+
+
+# Warm the yfinance import (pandas/numpy/requests transitively, several
+# hundred ms) in the background so the first price call doesn't stall an
+# async pipeline. Set AI_HEDGE_FUND_NO_PREFETCH to opt out in tests/CLIs
+# that never touch market data.
+def _prefetch_yf():
+    try:
+        _get_yf()
+    except Exception as e:  # leave the failure for the first real call to report
+        logger.debug("yfinance prefetch failed: %s", e)
+
+
+if not os.getenv("AI_HEDGE_FUND_NO_PREFETCH"):
+    threading.Thread(target=_prefetch_yf, daemon=True, name="yfinance-prefetch").start()
@@ -1,6 +1,9 @@
 from typing_extensions import Annotated, Sequence, TypedDict
 
+import atexit
 import operator
+import queue
+import threading
 from langchain_core.messages import BaseMessage
 
 
@@ -18,6 +21,43 @@ class AgentState(TypedDict):
     metadata: Annotated[dict[str, any], merge_dicts]
 
 
+def build_aggregated_signals(analyst_signals: dict, tickers: list[str]) -> dict[str, list[dict]]:
+    """
+    Invert analyst_signals (analyst -> ticker -> signal) into ticker -> [signal dicts].
+
+    The risk and portfolio agents both need this view; building it once per
+    state (cached under data["_aggregated_signals"]) replaces their duplicate
+    O(tickers x analysts) loops and repeated per-ticker dict lookups.
+    """
+    aggregated: dict[str, list[dict]] = {ticker: [] for ticker in tickers}
+    for analyst_id, signals in analyst_signals.items():
+        for ticker, entries in aggregated.items():
+            sig = signals.get(ticker)
+            if sig is not None:
+                entries.append({
+                    "analyst": analyst_id,
+                    "signal": sig.get("signal"),
+                    "confidence": sig.get("confidence"),
+                    "reasoning": sig.get("reasoning"),
+                })
+    # Sort each ticker's entries by analyst: list order isn't touched by
+    # sort_keys serialization, and a stable order keeps prompt bytes
+    # identical across runs so provider prefix caches can hit.
+    for entries in aggregated.values():
+        entries.sort(key=lambda s: s["analyst"])
+    return aggregated
+
+
+def get_aggregated_signals(state: "AgentState") -> dict[str, list[dict]]:
+    """Return the ticker -> signals index, computing and caching it on first use."""
+    data = state["data"]
+    aggregated = data.get("_aggregated_signals")
+    if aggregated is None:
+        aggregated = build_aggregated_signals(data.get("analyst_signals", {}), data["tickers"])
+        data["_aggregated_signals"] = aggregated
+    return aggregated
+
+
 def show_agent_reasoning(output, agent_name):
     print(f"\n{'=' * 10} {agent_name.center(28)} {'=' * 10}")
 
@@ -49,3 +89,44 @@ def show_agent_reasoning(output, agent_name):
             print(output)
 
     print("=" * 48)
+
+
+# Pretty-printing large JSON blobs to the terminal is slow enough to stall
+# the LLM pipeline when --show-reasoning is set. A single daemon printer
+# thread drains a bounded queue so agents enqueue and move on; one consumer
+# preserves output ordering, and the bound applies backpressure instead of
+# letting reasoning dumps pile up unboundedly.
+_reasoning_queue: queue.Queue = queue.Queue(maxsize=8)
+_printer_lock = threading.Lock()
+_printer_started = False
+
+
+def _drain_reasoning_queue():
+    while True:
+        output, agent_name = _reasoning_queue.get()
+        try:
+            show_agent_reasoning(output, agent_name)
+        except Exception as e:
+            # A payload that fails to serialize must not kill the only
+            # consumer: producers would then block forever on the full queue
+            print(f"Error printing reasoning for {agent_name}: {e}")
+        finally:
+            _reasoning_queue.task_done()
+
+
+def _ensure_printer_thread():
+    global _printer_started
+    if _printer_started:
+        return
+    with _printer_lock:
+        if not _printer_started:
+            threading.Thread(target=_drain_reasoning_queue, daemon=True).start()
+            # Flush anything still queued before the interpreter exits
+            atexit.register(_reasoning_queue.join)
+            _printer_started = True
+
+
+def queue_agent_reasoning(output, agent_name):
+    """Enqueue reasoning output for the background printer thread."""
+    _ensure_printer_thread()
+    _reasoning_queue.put((output, agent_name))
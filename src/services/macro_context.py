@@ -8,21 +8,41 @@ Fetches and analyzes:
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
 
 
+# VIX/TNX/SPX barely move on position-sizing timescales, so one fetch serves
+# the whole scan instead of three yfinance round-trips per ticker.
+_MACRO_TTL = 600.0  # seconds
+_macro_cache: dict = {"value": None, "ts": 0.0}
+
+
+def invalidate_macro_cache() -> None:
+    """Drop the cached macro context so the next call refetches."""
+    _macro_cache["value"] = None
+    _macro_cache["ts"] = 0.0
+
+
 def get_macro_context() -> dict:
     """
     Get current macro market context.
 
+    Cached for 10 minutes; call invalidate_macro_cache() to force a refetch.
+
     Returns:
         Dict with VIX, treasury rate, and market regime assessment
     """
+    if _macro_cache["value"] is not None and time.time() - _macro_cache["ts"] < _MACRO_TTL:
+        return _macro_cache["value"]
+
     context = {
         "vix": None,
         "vix_level": None,  # low, normal, elevated, high
@@ -33,22 +53,23 @@ def get_macro_context() -> dict:
     }
 
     try:
-        # Fetch VIX
-        vix = yf.Ticker("^VIX")
-        vix_hist = vix.history(period="5d")
+        # The three index fetches are independent HTTP round-trips, so run
+        # them concurrently: total latency is the slowest call, not the sum
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            vix_future = executor.submit(_fetch_history, "^VIX", "5d")
+            tnx_future = executor.submit(_fetch_history, "^TNX", "5d")
+            spy_future = executor.submit(_fetch_history, "^GSPC", "60d")
+            vix_hist = vix_future.result()
+            tnx_hist = tnx_future.result()
+            spy_hist = spy_future.result()
+
         if not vix_hist.empty:
             context["vix"] = round(vix_hist["Close"].iloc[-1], 2)
             context["vix_level"] = _classify_vix(context["vix"])
 
-        # Fetch 10-Year Treasury
-        tnx = yf.Ticker("^TNX")
-        tnx_hist = tnx.history(period="5d")
         if not tnx_hist.empty:
             context["treasury_10y"] = round(tnx_hist["Close"].iloc[-1], 2)
 
-        # Fetch S&P 500 trend
-        spy = yf.Ticker("^GSPC")
-        spy_hist = spy.history(period="60d")
         if not spy_hist.empty and len(spy_hist) >= 20:
             context["sp500_trend"] = _calculate_trend(spy_hist)
 
@@ -58,29 +79,47 @@ def get_macro_context() -> dict:
             context["sp500_trend"]
         )
 
+        # Only cache fully populated contexts: an empty history frame doesn't
+        # raise, and a transient data gap must not serve a degraded context
+        # for the whole TTL — leave it uncached so the next call refetches
+        if (
+            context["vix"] is not None
+            and context["treasury_10y"] is not None
+            and context["sp500_trend"] is not None
+        ):
+            _macro_cache["value"] = context
+            _macro_cache["ts"] = time.time()
+
     except Exception as e:
         logger.error(f"Error fetching macro context: {e}")
 
     return context
 
 
-def _classify_vix(vix: float) -> str:
-    """Classify VIX level."""
-    if vix < 15:
-        return "low"
-    elif vix < 20:
-        return "normal"
-    elif vix < 30:
-        return "elevated"
-    else:
-        return "high"
+def _fetch_history(symbol: str, period: str):
+    """Fetch price history for one index symbol."""
+    return yf.Ticker(symbol).history(period=period)
+
+
+# Bin edges for VIX classification; searchsorted keeps this branchless and
+# lets the same call classify a whole array of values at once
+_VIX_BINS = np.array([15.0, 20.0, 30.0])
+_VIX_NAMES = np.array(["low", "normal", "elevated", "high"])
+
+
+def _classify_vix(vix):
+    """Classify VIX level (accepts a scalar or an array)."""
+    level = _VIX_NAMES[np.searchsorted(_VIX_BINS, vix, side="right")]
+    return level if isinstance(level, np.ndarray) else str(level)
 
 
 def _calculate_trend(hist) -> str:
     """Calculate S&P 500 trend based on moving averages."""
-    current = hist["Close"].iloc[-1]
-    ma20 = hist["Close"].tail(20).mean()
-    ma50 = hist["Close"].tail(50).mean() if len(hist) >= 50 else ma20
+    # Plain NumPy slicing: pandas indexing overhead dominates at this size
+    closes = hist["Close"].to_numpy(dtype=np.float64)
+    current = closes[-1]
+    ma20 = closes[-20:].mean()
+    ma50 = closes[-50:].mean() if closes.size >= 50 else ma20
 
     # Simple trend calculation
     if current > ma20 > ma50:
@@ -13,9 +13,42 @@ from typing import Optional
 import yfinance as yf
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _daily_vol(closes: np.ndarray) -> float:
+        """One-pass sample std of daily returns, no intermediate arrays."""
+        n = closes.size - 1
+        if n < 2:
+            return 0.0
+        mean = 0.0
+        for i in range(n):
+            mean += closes[i + 1] / closes[i] - 1.0
+        mean /= n
+        s2 = 0.0
+        for i in range(n):
+            d = closes[i + 1] / closes[i] - 1.0 - mean
+            s2 += d * d
+        return (s2 / (n - 1)) ** 0.5
+
+else:
+
+    def _daily_vol(closes: np.ndarray) -> float:
+        """Sample std of daily returns (vectorized NumPy fallback)."""
+        if closes.size < 3:
+            return 0.0
+        returns = np.diff(closes) / closes[:-1]
+        return float(returns.std(ddof=1))
+
+
 def calculate_position_sizing(
     ticker: str,
     conviction: int,
@@ -54,9 +87,10 @@ def calculate_position_sizing(
             result["recommended_pct"] = min_position_pct
             return result
 
-        # Calculate daily returns and volatility
-        returns = hist["Close"].pct_change().dropna()
-        daily_vol = returns.std()
+        # Calculate daily returns and volatility on the raw NumPy array;
+        # pandas per-call overhead dominates arithmetic at this size
+        closes = hist["Close"].to_numpy(dtype=np.float64)
+        daily_vol = _daily_vol(closes)
         annual_vol = daily_vol * np.sqrt(252)  # Annualize
 
         result["volatility_daily"] = round(daily_vol * 100, 2)  # As percentage
@@ -96,3 +130,105 @@ def calculate_position_sizing(
         result["sizing_rationale"] = f"Error in calculation: {str(e)}"
 
     return result
+
+
+def calculate_position_sizing_batch(
+    tickers: list[str],
+    convictions: dict[str, int],
+    signals: dict[str, str],
+    max_position_pct: float = 10.0,
+    min_position_pct: float = 1.0,
+) -> dict[str, dict]:
+    """
+    Calculate recommended position sizes for many tickers at once.
+
+    One multi-ticker download replaces a per-ticker history fetch, and the
+    volatility math runs as single NumPy reductions over the whole
+    (days x tickers) close matrix instead of N independent Python passes.
+
+    Args:
+        tickers: Stock ticker symbols
+        convictions: Ticker -> conviction level 0-100
+        signals: Ticker -> "bullish" or "bearish"
+        max_position_pct: Maximum position size as % of portfolio
+        min_position_pct: Minimum position size as % of portfolio
+
+    Returns:
+        Dict mapping ticker to the same result dict as calculate_position_sizing
+    """
+    if not tickers:
+        return {}
+    if len(tickers) == 1:
+        ticker = tickers[0]
+        return {
+            ticker: calculate_position_sizing(
+                ticker,
+                convictions.get(ticker, 0),
+                signals.get(ticker, "bullish"),
+                max_position_pct,
+                min_position_pct,
+            )
+        }
+
+    try:
+        closes = yf.download(
+            " ".join(tickers),
+            period="6mo",
+            progress=False,
+            threads=True,
+        )["Close"]
+    except Exception as e:
+        logger.error(f"Batch download failed for position sizing: {e}")
+        return {
+            ticker: calculate_position_sizing(
+                ticker,
+                convictions.get(ticker, 0),
+                signals.get(ticker, "bullish"),
+                max_position_pct,
+                min_position_pct,
+            )
+            for ticker in tickers
+        }
+
+    # Vectorized volatility across the whole universe
+    daily_vols = closes.pct_change().std()
+    annual_vols = daily_vols * np.sqrt(252)
+    counts = closes.count()
+
+    conviction_arr = np.array([convictions.get(t, 0) for t in tickers], dtype=np.float64)
+    daily_arr = np.array([daily_vols.get(t, np.nan) for t in tickers])
+    annual_arr = np.array([annual_vols.get(t, np.nan) for t in tickers])
+
+    base_sizes = (conviction_arr / 100) * max_position_pct
+    vol_factors = np.minimum(1.0, 0.20 / np.maximum(annual_arr, 0.10))
+    recommended = np.clip(base_sizes * vol_factors, min_position_pct, max_position_pct)
+    max_risks = recommended * (daily_arr * 2 * 100)
+
+    results: dict[str, dict] = {}
+    for i, ticker in enumerate(tickers):
+        if int(counts.get(ticker, 0)) < 20 or np.isnan(annual_arr[i]):
+            results[ticker] = {
+                "recommended_pct": min_position_pct,
+                "max_risk_pct": None,
+                "volatility_annual": None,
+                "volatility_daily": None,
+                "sizing_rationale": "Insufficient price history for volatility calculation",
+            }
+            continue
+
+        annual_vol = float(annual_arr[i])
+        vol_desc = "high" if annual_vol > 0.40 else "moderate" if annual_vol > 0.25 else "low"
+        recommended_pct = round(float(recommended[i]), 2)
+        volatility_annual = round(annual_vol * 100, 2)
+        results[ticker] = {
+            "recommended_pct": recommended_pct,
+            "max_risk_pct": round(float(max_risks[i]), 2),
+            "volatility_annual": volatility_annual,
+            "volatility_daily": round(float(daily_arr[i]) * 100, 2),
+            "sizing_rationale": (
+                f"{convictions.get(ticker, 0)}% conviction with {vol_desc} volatility "
+                f"({volatility_annual}% annual). Recommended {recommended_pct}% position."
+            ),
+        }
+
+    return results
@@ -6,19 +6,47 @@ using multiple analyst agents to identify high-conviction investment opportuniti
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import itertools
 import logging
 import os
 import json
-from datetime import datetime, timedelta
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Callable, Any
 from uuid import uuid4
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from src.agents.memo_schema import InvestmentMemo, should_generate_memo
-from src.data.yfinance_client import get_current_price, get_market_cap, get_price_change, get_upcoming_catalysts
+try:
+    # libyaml's C loader parses ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+
+    def _dumps_result(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+
+    def _loads_result(data: bytes):
+        return orjson.loads(data)
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+
+    def _dumps_result(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    def _loads_result(data: bytes):
+        return json.loads(data)
+
+from src.agents.memo_schema import InvestmentMemo, MEMO_CONVICTION_THRESHOLD
+from src.data.yfinance_client import batch_get_price_changes, batch_get_prices, get_current_price, get_market_cap, get_price_change, get_upcoming_catalysts
 from src.graph.state import AgentState
 from src.utils.analysts import ANALYST_CONFIG
 from src.services.macro_context import get_macro_context
@@ -32,6 +60,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONVICTION_THRESHOLD = 70
 
 
+@functools.lru_cache(maxsize=4)
+def _analysis_start_date(end_date: str) -> str:
+    """Start of the one-year analysis window ending at end_date."""
+    return (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=365)).strftime("%Y-%m-%d")
+
+
+def _chunks(seq, n):
+    """Yield successive n-sized chunks from seq without copying it wholesale."""
+    it = iter(seq)
+    while chunk := list(itertools.islice(it, n)):
+        yield chunk
+
+
 class ScanConfig(BaseModel):
     """Configuration for a scan run."""
     conviction_threshold: int = DEFAULT_CONVICTION_THRESHOLD
@@ -39,12 +80,15 @@ class ScanConfig(BaseModel):
     rate_limit_delay: float = 1.0  # seconds between batches
     max_retries: int = 3
     timeout_per_ticker: float = 60.0  # seconds
+    # Concurrent tickers in flight; sized for typical OpenAI/Anthropic RPM
+    # caps so we saturate the provider without tripping 429 retries.
+    max_concurrency: int = 8
 
 
 class ScanResult(BaseModel):
     """Result of a scanner run on a universe of stocks."""
     scan_id: str = Field(default_factory=lambda: str(uuid4()))
-    start_time: datetime = Field(default_factory=datetime.utcnow)
+    start_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     end_time: Optional[datetime] = None
     status: str = "running"  # running, completed, failed, cancelled
 
@@ -59,32 +103,108 @@ class ScanResult(BaseModel):
     memos_generated: int = 0
     high_conviction_memos: list[dict] = []
     errors: list[str] = []
+    # Append-only .jsonl holding the full memos when streaming is enabled
+    memos_path: Optional[str] = None
 
     # Performance metrics
     avg_processing_time_per_ticker: Optional[float] = None
 
+    _memo_stream: Optional[Any] = PrivateAttr(default=None)
+    # Monotonic start for duration math; wall-clock datetimes can step under
+    # NTP adjustments, and utcnow() is deprecated on 3.12+
+    _start_monotonic: float = PrivateAttr(default_factory=time.monotonic)
+
+    def attach_memo_stream(self, path) -> None:
+        """Stream full memos to an append-only .jsonl at `path`.
+
+        With a stream attached, high_conviction_memos holds compact summaries
+        instead of full memo dumps, so memory stays constant regardless of
+        universe size and a crashed scan leaves its memos on disk.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._memo_stream = open(path, "a")
+        self.memos_path = str(path)
+
+    def close_memo_stream(self) -> None:
+        """Close the memo stream if one is attached."""
+        if self._memo_stream is not None:
+            self._memo_stream.close()
+            self._memo_stream = None
+
+    def full_memos(self) -> list[dict]:
+        """Full memo dicts for downstream consumers (inbox, email, scripts).
+
+        When memos were streamed to disk, high_conviction_memos only holds
+        compact summaries; this reads the complete memos back from the
+        .jsonl. Without a stream it returns the in-memory list unchanged.
+        """
+        if self.memos_path:
+            if self._memo_stream is not None:
+                self._memo_stream.flush()
+            try:
+                return load_memo_stream(self.memos_path)
+            except OSError as e:
+                logger.warning(f"Could not read memo stream {self.memos_path}: {e}")
+        return self.high_conviction_memos
+
     def add_memo(self, memo: InvestmentMemo):
         """Add a high conviction memo to results."""
-        if memo.conviction >= self.conviction_threshold:
+        if memo.conviction < self.conviction_threshold:
+            return
+
+        if self._memo_stream is not None:
+            self._memo_stream.write(memo.model_dump_json() + "\n")
+            self.high_conviction_memos.append(
+                {
+                    "ticker": memo.ticker,
+                    "analyst": memo.analyst,
+                    "signal": memo.signal,
+                    "conviction": memo.conviction,
+                    "current_price": memo.current_price,
+                    "target_price": memo.target_price,
+                    "thesis": memo.thesis[:200],
+                }
+            )
+        else:
             self.high_conviction_memos.append(memo.model_dump())
-            self.memos_generated += 1
+        self.memos_generated += 1
 
     def complete(self):
         """Mark scan as completed."""
-        self.end_time = datetime.utcnow()
+        self.close_memo_stream()
+        self.end_time = datetime.now(timezone.utc)
         self.status = "completed"
 
-        if self.tickers_scanned > 0 and self.start_time and self.end_time:
-            duration = (self.end_time - self.start_time).total_seconds()
+        if self.tickers_scanned > 0:
+            duration = time.monotonic() - self._start_monotonic
             self.avg_processing_time_per_ticker = duration / self.tickers_scanned
 
     def fail(self, error: str):
         """Mark scan as failed."""
-        self.end_time = datetime.utcnow()
+        self.close_memo_stream()
+        self.end_time = datetime.now(timezone.utc)
         self.status = "failed"
         self.errors.append(error)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> dict:
+    """Parse a YAML file, memoized on (path, mtime).
+
+    Repeated CLI/scripted invocations within a process re-read the same
+    configs; keying on mtime keeps the cache correct across edits. Callers
+    must treat the returned dict as read-only.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def load_yaml_config(config_path) -> dict:
+    """Load a YAML config through the mtime-keyed cache."""
+    path = str(config_path)
+    return _load_yaml_cached(path, os.path.getmtime(path))
+
+
 def load_universe_config(config_path: Optional[str] = None) -> dict:
     """
     Load universe configuration from YAML file.
@@ -102,8 +222,7 @@ def load_universe_config(config_path: Optional[str] = None) -> dict:
         config_path = project_root / "config" / "universe.yaml"
 
     try:
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        return load_yaml_config(config_path)
     except FileNotFoundError:
         logger.warning(f"Universe config not found at {config_path}, using defaults")
         return {"sp500": [], "russell2000_sample": []}
@@ -128,10 +247,9 @@ def load_scanner_config(config_path: Optional[str] = None) -> ScanConfig:
         config_path = project_root / "config" / "scanner.yaml"
 
     try:
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
-            scanner_config = config_data.get("scanner", {})
-            return ScanConfig(**scanner_config)
+        config_data = load_yaml_config(config_path)
+        scanner_config = config_data.get("scanner", {})
+        return ScanConfig(**scanner_config)
     except FileNotFoundError:
         logger.warning(f"Scanner config not found at {config_path}, using defaults")
         return ScanConfig()
@@ -190,7 +308,15 @@ def get_sector_tickers(
     return sectors.get(sector, [])
 
 
-# Map analyst keys to their agent functions
+# Map analyst keys to their agent functions, built once since ANALYST_CONFIG
+# is fixed at import time
+_ANALYST_AGENTS: dict[str, tuple[str, Callable]] = {
+    key: (config["display_name"], config["agent_func"])
+    for key, config in ANALYST_CONFIG.items()
+    if config.get("type") == "analyst"
+}
+
+
 def get_analyst_agents() -> dict[str, tuple[str, Callable]]:
     """
     Get mapping of analyst keys to their agent functions.
@@ -198,11 +324,7 @@ def get_analyst_agents() -> dict[str, tuple[str, Callable]]:
     Returns:
         Dict mapping analyst key to (display_name, agent_function)
     """
-    return {
-        key: (config["display_name"], config["agent_func"])
-        for key, config in ANALYST_CONFIG.items()
-        if config.get("type") == "analyst"
-    }
+    return _ANALYST_AGENTS
 
 
 # Default set of value-oriented analysts for scanning
@@ -257,8 +379,51 @@ class Scanner:
         if not self.analysts:
             raise ValueError("No valid analysts specified")
 
+        # Dedicated pool sized to the real fan-out (analysts x concurrent
+        # tickers) instead of the default executor, whose cpu-based sizing
+        # both oversubscribes under full scans and caps I/O-bound throughput.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.analysts) * self.config.max_concurrency,
+            thread_name_prefix="scanner",
+        )
+
+        # Universe prices prefetched in one batched download per scan, so
+        # per-ticker analysis reads from memory instead of hitting yfinance
+        self._price_cache: dict[str, Optional[float]] = {}
+
+        # Fixed per-scanner metadata, copied into each agent state
+        self._metadata_template = {
+            "show_reasoning": False,
+            "model_name": self.model_name,
+            "model_provider": self.model_provider,
+        }
+
+        # Per-scan failure counts; tickers that keep erroring (delisted,
+        # rate-limited, bad symbol) are skipped instead of re-burning the
+        # HTTP and LLM budget every batch
+        self._fail_counts: Counter = Counter()
+
         logger.info(f"Scanner initialized with {len(self.analysts)} analysts: {list(self.analysts.keys())}")
 
+    def _price(self, ticker: str) -> Optional[float]:
+        """Current price from the per-scan cache, fetching once on a miss."""
+        price = self._price_cache.get(ticker)
+        if price is None:
+            price = get_current_price(ticker)
+            if price is not None:
+                self._price_cache[ticker] = price
+        return price
+
+    def close(self):
+        """Shut down the scanner's thread pool."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
     def _create_agent_state(
         self,
         ticker: str,
@@ -277,7 +442,9 @@ class Scanner:
         if end_date is None:
             end_date = datetime.now().strftime("%Y-%m-%d")
 
-        start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        # Dates and metadata are identical for every analyst/ticker in a scan,
+        # so the window is memoized and the metadata template copied
+        start_date = _analysis_start_date(end_date)
 
         return {
             "messages": [],
@@ -288,11 +455,7 @@ class Scanner:
                 "end_date": end_date,
                 "analyst_signals": {},
             },
-            "metadata": {
-                "show_reasoning": False,
-                "model_name": self.model_name,
-                "model_provider": self.model_provider,
-            },
+            "metadata": self._metadata_template.copy(),
         }
 
     def _extract_memo_from_signal(
@@ -303,6 +466,7 @@ class Scanner:
         current_price: Optional[float] = None,
         catalysts: Optional[dict] = None,
         macro_context: Optional[dict] = None,
+        conviction_threshold: Optional[int] = None,
     ) -> Optional[InvestmentMemo]:
         """
         Extract an InvestmentMemo from analyst signal data.
@@ -314,22 +478,28 @@ class Scanner:
             current_price: Current stock price
             catalysts: Pre-fetched catalyst data
             macro_context: Pre-fetched macro context
+            conviction_threshold: Minimum conviction (defaults to memo threshold)
 
         Returns:
             InvestmentMemo if signal meets conviction threshold, else None
         """
+        if conviction_threshold is None:
+            conviction_threshold = MEMO_CONVICTION_THRESHOLD
+
         try:
             signal = signal_data.get("signal", "neutral")
             confidence = signal_data.get("confidence", 0)
             reasoning = signal_data.get("reasoning", "")
 
-            # Only create memo for bullish/bearish signals with high conviction
-            if signal == "neutral" or not should_generate_memo(confidence):
+            # Only create memo for bullish/bearish signals with high conviction;
+            # checking before any fetch or model construction keeps sub-threshold
+            # signals (the common case) essentially free
+            if signal == "neutral" or confidence < conviction_threshold:
                 return None
 
             # Get price if not provided
             if current_price is None:
-                current_price = get_current_price(ticker) or 0.0
+                current_price = self._price(ticker) or 0.0
 
             # Conviction-based target price (instead of fixed 20%)
             # Higher conviction = higher expected move
@@ -393,10 +563,18 @@ class Scanner:
             List of high-conviction InvestmentMemos
         """
         memos = []
-        state = self._create_agent_state(ticker, end_date)
 
-        # Get current price once for all analysts
-        current_price = get_current_price(ticker)
+        # Resolve the date once so each analyst's state skips the strftime
+        if end_date is None:
+            end_date = datetime.now().strftime("%Y-%m-%d")
+
+        # Get current price once for all analysts (prefetched during full
+        # scans); resolved eagerly so memo extraction never refetches
+        current_price = self._price(ticker) or 0.0
+
+        # Anything below the scan threshold would be dropped by add_memo
+        # anyway, so don't bother building the memo at all
+        memo_threshold = max(MEMO_CONVICTION_THRESHOLD, self.config.conviction_threshold)
 
         # Fetch enrichment data once per ticker
         try:
@@ -411,36 +589,46 @@ class Scanner:
             logger.warning(f"Could not fetch macro context: {e}")
             macro_context = None
 
-        for analyst_key, (analyst_name, agent_func) in self.analysts.items():
-            try:
+        # Analysts are independent LLM calls, so run them concurrently:
+        # per-ticker latency becomes ~max(analyst latency) instead of the sum.
+        # Each analyst gets its own state so agents never mutate a shared dict.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.analysts)) as executor:
+            futures = {}
+            for analyst_key, (analyst_name, agent_func) in self.analysts.items():
                 logger.debug(f"Analyzing {ticker} with {analyst_name}")
-
-                # Run the analyst agent
-                result = agent_func(state, agent_id=f"{analyst_key}_agent")
-
-                # Extract signal from result
-                signals = result.get("data", {}).get("analyst_signals", {})
-                agent_signal = signals.get(f"{analyst_key}_agent", {})
-                ticker_signal = agent_signal.get(ticker, {})
-
-                if ticker_signal:
-                    memo = self._extract_memo_from_signal(
-                        ticker,
-                        analyst_key,
-                        ticker_signal,
-                        current_price,
-                        catalysts=catalysts,
-                        macro_context=macro_context,
-                    )
-                    if memo:
-                        memos.append(memo)
-                        logger.info(
-                            f"Generated memo for {ticker} from {analyst_name}: "
-                            f"{memo.signal} ({memo.conviction}%)"
+                state = self._create_agent_state(ticker, end_date)
+                future = executor.submit(agent_func, state, agent_id=f"{analyst_key}_agent")
+                futures[future] = (analyst_key, analyst_name)
+
+            for future in concurrent.futures.as_completed(futures):
+                analyst_key, analyst_name = futures[future]
+                try:
+                    result = future.result()
+
+                    # Extract signal from result
+                    signals = result.get("data", {}).get("analyst_signals", {})
+                    agent_signal = signals.get(f"{analyst_key}_agent", {})
+                    ticker_signal = agent_signal.get(ticker, {})
+
+                    if ticker_signal:
+                        memo = self._extract_memo_from_signal(
+                            ticker,
+                            analyst_key,
+                            ticker_signal,
+                            current_price,
+                            catalysts=catalysts,
+                            macro_context=macro_context,
+                            conviction_threshold=memo_threshold,
                         )
+                        if memo:
+                            memos.append(memo)
+                            logger.info(
+                                f"Generated memo for {ticker} from {analyst_name}: "
+                                f"{memo.signal} ({memo.conviction}%)"
+                            )
 
-            except Exception as e:
-                logger.error(f"Error running {analyst_name} on {ticker}: {e}")
+                except Exception as e:
+                    logger.error(f"Error running {analyst_name} on {ticker}: {e}")
 
         return memos
 
@@ -459,10 +647,12 @@ class Scanner:
         Returns:
             List of high-conviction InvestmentMemos
         """
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run in the scanner's own pool to avoid blocking the event loop.
+        # get_running_loop avoids the deprecated get_event_loop lookup; the
+        # dedicated executor is why this isn't simply asyncio.to_thread.
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            self._executor,
             self.analyze_ticker,
             ticker,
             end_date,
@@ -473,35 +663,56 @@ class Scanner:
         tickers: list[str],
         result: ScanResult,
         end_date: Optional[str] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> list[InvestmentMemo]:
         """
-        Scan a batch of tickers.
+        Scan a batch of tickers concurrently.
+
+        Tickers run in parallel, bounded by the semaphore (when given) so the
+        steady-state number of in-flight LLM requests stays at the provider's
+        rate-limit sweet spot instead of stampeding into 429 retries.
 
         Args:
             tickers: List of ticker symbols
             result: ScanResult to update
             end_date: End date for analysis
+            semaphore: Optional concurrency bound shared across batches
 
         Returns:
             List of high-conviction memos from the batch
         """
-        batch_memos = []
-
-        for ticker in tickers:
-            try:
-                memos = await self.analyze_ticker_async(ticker, end_date)
-                batch_memos.extend(memos)
+        async def _scan_one(ticker: str) -> list[InvestmentMemo]:
+            if semaphore is None:
+                return await self.analyze_ticker_async(ticker, end_date)
+            async with semaphore:
+                return await self.analyze_ticker_async(ticker, end_date)
+
+        # Circuit breaker: drop tickers that already failed max_retries times
+        skipped = [t for t in tickers if self._fail_counts[t] >= self.config.max_retries]
+        if skipped:
+            logger.info(f"Skipping {len(skipped)} repeatedly-failing tickers: {skipped}")
+            tickers = [t for t in tickers if self._fail_counts[t] < self.config.max_retries]
 
-                for memo in memos:
-                    result.add_memo(memo)
-
-                result.tickers_scanned += 1
-                logger.info(f"Scanned {ticker}: {len(memos)} high-conviction signals")
+        batch_memos = []
+        outcomes = await asyncio.gather(
+            *(_scan_one(ticker) for ticker in tickers),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                error_msg = f"Error scanning {ticker}: {e}"
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, BaseException):
+                self._fail_counts[ticker] += 1
+                error_msg = f"Error scanning {ticker}: {outcome}"
                 logger.error(error_msg)
                 result.errors.append(error_msg)
+                continue
+
+            batch_memos.extend(outcome)
+            for memo in outcome:
+                result.add_memo(memo)
+
+            result.tickers_scanned += 1
+            logger.info(f"Scanned {ticker}: {len(outcome)} high-conviction signals")
 
         return batch_memos
 
@@ -534,20 +745,43 @@ class Scanner:
             f"{len(self.analysts)} analysts (threshold: {self.config.conviction_threshold}%)"
         )
 
+        self._fail_counts.clear()
+
+        # Stream full memos to disk as they are generated; memory use stays
+        # flat for large universes and a failed scan keeps its memos
         try:
-            # Process in batches
-            batches = [
-                universe[i:i + self.config.batch_size]
-                for i in range(0, len(universe), self.config.batch_size)
-            ]
+            current_dir = Path(__file__).resolve().parent
+            timestamp = result.start_time.strftime("%Y%m%d_%H%M%S")
+            memos_path = (
+                current_dir.parent.parent / ".cache" / "scans"
+                / f"scan_{universe_name}_{timestamp}.memos.jsonl"
+            )
+            result.attach_memo_stream(memos_path)
+        except OSError as e:
+            logger.warning(f"Could not open memo stream, keeping memos in memory: {e}")
 
-            for batch_num, batch in enumerate(batches, 1):
-                logger.info(f"Processing batch {batch_num}/{len(batches)} ({len(batch)} tickers)")
+        try:
+            # One multiplexed download for the whole universe replaces an HTTP
+            # round-trip per ticker inside analyze_ticker
+            try:
+                self._price_cache = await asyncio.to_thread(batch_get_prices, universe)
+            except Exception as e:
+                logger.warning(f"Price prefetch failed, falling back to per-ticker fetches: {e}")
+                self._price_cache = {}
+
+            # Process in lazily sliced batches; the universe list is never
+            # duplicated up front
+            total_batches = -(-len(universe) // self.config.batch_size)
+
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
-                await self.scan_batch(batch, result, end_date)
+            for batch_num, batch in enumerate(_chunks(universe, self.config.batch_size), 1):
+                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} tickers)")
+
+                await self.scan_batch(batch, result, end_date, semaphore=semaphore)
 
                 # Rate limiting between batches
-                if batch_num < len(batches):
+                if batch_num < total_batches:
                     await asyncio.sleep(self.config.rate_limit_delay)
 
             result.complete()
@@ -626,11 +860,19 @@ def get_triggered_tickers(
     Returns:
         List of tickers that exceeded the threshold
     """
-    triggered = []
-    for ticker in tickers:
-        if check_price_trigger(ticker, threshold, days):
-            triggered.append(ticker)
-    return triggered
+    # One batched history download covers every ticker's change; tickers the
+    # batch could not price simply don't trigger, matching the old behavior
+    try:
+        changes = batch_get_price_changes(tickers, days)
+    except Exception as e:
+        logger.error(f"Batch trigger check failed, falling back to per-ticker: {e}")
+        return [t for t in tickers if check_price_trigger(t, threshold, days)]
+
+    return [
+        ticker
+        for ticker in tickers
+        if changes.get(ticker) is not None and abs(changes[ticker]) >= threshold
+    ]
 
 
 def save_scan_result(result: ScanResult, output_dir: Optional[str] = None) -> str:
@@ -656,13 +898,32 @@ def save_scan_result(result: ScanResult, output_dir: Optional[str] = None) -> st
     filename = f"scan_{result.universe_name}_{timestamp}.json"
     filepath = output_path / filename
 
-    with open(filepath, "w") as f:
-        json.dump(result.model_dump(), f, indent=2, default=str)
+    with open(filepath, "wb") as f:
+        f.write(_dumps_result(result.model_dump()))
 
     logger.info(f"Scan results saved to {filepath}")
     return str(filepath)
 
 
+def load_memo_stream(filepath: str) -> list[dict]:
+    """
+    Load full memos from a streamed .jsonl file.
+
+    Args:
+        filepath: Path to the .memos.jsonl file (ScanResult.memos_path)
+
+    Returns:
+        List of memo dictionaries
+    """
+    memos = []
+    with open(filepath, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                memos.append(json.loads(line))
+    return memos
+
+
 def load_scan_result(filepath: str) -> ScanResult:
     """
     Load scan results from JSON file.
@@ -673,6 +934,6 @@ def load_scan_result(filepath: str) -> ScanResult:
     Returns:
         ScanResult object
     """
-    with open(filepath, "r") as f:
-        data = json.load(f)
+    with open(filepath, "rb") as f:
+        data = _loads_result(f.read())
     return ScanResult(**data)
@@ -70,24 +70,32 @@ ANALYST_CONFIG = {
     },
 }
 
+# ANALYST_CONFIG never changes after import, so its derivatives are built
+# once here instead of re-sorted/re-comprehended on every call
+_SORTED_CONFIG = tuple(sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"]))
+
 # Derive ANALYST_ORDER from ANALYST_CONFIG for backwards compatibility
-ANALYST_ORDER = [(config["display_name"], key) for key, config in sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"])]
+ANALYST_ORDER = [(config["display_name"], key) for key, config in _SORTED_CONFIG]
+
+_ANALYST_NODES = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+
+_AGENTS_LIST = tuple(
+    {
+        "key": key,
+        "display_name": config["display_name"],
+        "description": config["description"],
+        "investing_style": config["investing_style"],
+        "order": config["order"]
+    }
+    for key, config in _SORTED_CONFIG
+)
 
 
 def get_analyst_nodes():
     """Get the mapping of analyst keys to their (node_name, agent_func) tuples."""
-    return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    return _ANALYST_NODES
 
 
 def get_agents_list():
     """Get the list of agents for API responses."""
-    return [
-        {
-            "key": key,
-            "display_name": config["display_name"],
-            "description": config["description"],
-            "investing_style": config["investing_style"],
-            "order": config["order"]
-        }
-        for key, config in sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"])
-    ]
+    return list(_AGENTS_LIST)
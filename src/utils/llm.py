@@ -1,12 +1,53 @@
 """Helper functions for LLM"""
 
+import hashlib
 import json
+from collections import OrderedDict
+from typing import Iterator
+from langchain_core.messages import SystemMessage
+from langchain_core.prompt_values import ChatPromptValue
 from pydantic import BaseModel
 from src.llm.models import get_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
 
+# Exact-match response cache: prompts here are deterministic functions of
+# (tickers, signals, positions, cash), so identical prompts recur across
+# re-scans and retries within a process. Keyed on a BLAKE2b digest of the
+# prompt text + model + schema name; values are the validated model's JSON,
+# so hits rebuild via model_validate_json without a network call. Bounded
+# with LRU eviction so a long-running scheduler can't accumulate every
+# unique response forever.
+_RESPONSE_CACHE_MAX = 256
+_response_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _response_cache_key(prompt, model_name: str, model_provider: str, pydantic_model: type[BaseModel]) -> str:
+    prompt_text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+    payload = f"{model_provider}:{model_name}:{pydantic_model.__name__}:{prompt_text}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _response_cache_get(key: str) -> str | None:
+    value = _response_cache.get(key)
+    if value is not None:
+        _response_cache.move_to_end(key)
+    return value
+
+
+def _response_cache_put(key: str, value: str) -> None:
+    _response_cache[key] = value
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+
+def clear_llm_response_cache():
+    """Drop all cached LLM responses — for tests and long-running processes."""
+    _response_cache.clear()
+
+
 def call_llm(
     prompt: any,
     pydantic_model: type[BaseModel],
@@ -14,7 +55,9 @@ def call_llm(
     state: AgentState | None = None,
     max_retries: int = 3,
     default_factory=None,
-) -> BaseModel:
+    response_schema: dict | None = None,
+    return_dict: bool = False,
+) -> BaseModel | dict:
     """
     Makes an LLM call with retry logic, handling both JSON supported and non-JSON supported models.
 
@@ -25,9 +68,15 @@ def call_llm(
         state: Optional state object to extract agent-specific model configuration
         max_retries: Maximum number of retries (default: 3)
         default_factory: Optional factory function to create default response on failure
+        response_schema: Optional precomputed JSON schema (from `model_json_schema()`) to
+            pass to the provider's native structured-output API. Enforces the output
+            grammar server-side, so prompts no longer need JSON-format boilerplate.
+        return_dict: If True, return the parsed output as a plain dict and skip
+            materializing the Pydantic model — for callers that immediately
+            re-serialize the result anyway.
 
     Returns:
-        An instance of the specified Pydantic model
+        An instance of the specified Pydantic model, or a dict if return_dict=True
     """
     
     # Extract model configuration if state is provided and agent_name is available
@@ -45,15 +94,45 @@ def call_llm(
         if request and hasattr(request, 'api_keys'):
             api_keys = request.api_keys
 
+    # Check the exact-match response cache before paying for a network call
+    cache_key = None
+    if not (state and state.get("metadata", {}).get("no_cache")):
+        cache_key = _response_cache_key(prompt, model_name, model_provider, pydantic_model)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached) if return_dict else pydantic_model.model_validate_json(cached)
+
     model_info = get_model_info(model_name, model_provider)
     llm = get_model(model_name, model_provider, api_keys)
 
-    # For non-JSON support models, we can use structured output
+    # Anthropic caches prompt prefixes only at explicit cache points; mark the
+    # leading system blocks so their (static) content is reused across calls.
+    if str(model_provider).lower() == "anthropic":
+        prompt = _mark_prompt_cache_points(prompt)
+
+    # For JSON-capable models, we can use structured output
+    schema_mode = False
     if not (model_info and not model_info.has_json_mode()):
-        llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
-        )
+        if response_schema is not None:
+            # Bind the precompiled schema so the provider enforces the grammar
+            # (OpenAI json_schema response_format / Anthropic tool use).
+            try:
+                llm = llm.with_structured_output(
+                    response_schema,
+                    method="json_schema",
+                )
+                schema_mode = True
+            except Exception:
+                # Provider integration doesn't support raw JSON schemas; fall back
+                llm = llm.with_structured_output(
+                    pydantic_model,
+                    method="json_mode",
+                )
+        else:
+            llm = llm.with_structured_output(
+                pydantic_model,
+                method="json_mode",
+            )
 
     # Call the LLM with retries
     for attempt in range(max_retries):
@@ -65,9 +144,22 @@ def call_llm(
             if model_info and not model_info.has_json_mode():
                 parsed_result = extract_json_from_response(result.content)
                 if parsed_result:
-                    return pydantic_model(**parsed_result)
+                    # Validate before returning or caching: JSON that parses but
+                    # doesn't match the schema must hit the retry/default path,
+                    # not flow back to callers (or get replayed from the cache)
+                    validated = pydantic_model(**parsed_result)
+                    if cache_key is not None:
+                        _response_cache_put(cache_key, validated.model_dump_json())
+                    return validated.model_dump() if return_dict else validated
+            elif schema_mode:
+                # Schema-bound calls return the parsed dict; validate into the model
+                if cache_key is not None:
+                    _response_cache_put(cache_key, json.dumps(result))
+                return result if return_dict else pydantic_model.model_validate(result)
             else:
-                return result
+                if cache_key is not None:
+                    _response_cache_put(cache_key, result.model_dump_json())
+                return result.model_dump() if return_dict else result
 
         except Exception as e:
             if agent_name:
@@ -76,12 +168,247 @@ def call_llm(
             if attempt == max_retries - 1:
                 print(f"Error in LLM call after {max_retries} attempts: {e}")
                 # Use default_factory if provided, otherwise create a basic default
-                if default_factory:
-                    return default_factory()
-                return create_default_response(pydantic_model)
+                default = default_factory() if default_factory else create_default_response(pydantic_model)
+                return default.model_dump() if return_dict else default
 
     # This should never be reached due to the retry logic above
-    return create_default_response(pydantic_model)
+    default = create_default_response(pydantic_model)
+    return default.model_dump() if return_dict else default
+
+
+async def acall_llm(
+    prompt: any,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+    max_retries: int = 3,
+    default_factory=None,
+    response_schema: dict | None = None,
+    return_dict: bool = False,
+) -> BaseModel | dict:
+    """
+    Async twin of call_llm, for callers that overlap independent LLM calls
+    with asyncio.gather. Uses the chat model's native ainvoke rather than a
+    separate async client, so provider selection and structured output work
+    exactly as in the sync path. Same arguments and return contract as
+    call_llm.
+    """
+    if state and agent_name:
+        model_name, model_provider = get_agent_model_config(state, agent_name)
+    else:
+        model_name = "gpt-4.1"
+        model_provider = "OPENAI"
+
+    api_keys = None
+    if state:
+        request = state.get("metadata", {}).get("request")
+        if request and hasattr(request, 'api_keys'):
+            api_keys = request.api_keys
+
+    # Check the exact-match response cache before paying for a network call
+    cache_key = None
+    if not (state and state.get("metadata", {}).get("no_cache")):
+        cache_key = _response_cache_key(prompt, model_name, model_provider, pydantic_model)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return json.loads(cached) if return_dict else pydantic_model.model_validate_json(cached)
+
+    model_info = get_model_info(model_name, model_provider)
+    llm = get_model(model_name, model_provider, api_keys)
+
+    if str(model_provider).lower() == "anthropic":
+        prompt = _mark_prompt_cache_points(prompt)
+
+    schema_mode = False
+    if not (model_info and not model_info.has_json_mode()):
+        if response_schema is not None:
+            try:
+                llm = llm.with_structured_output(
+                    response_schema,
+                    method="json_schema",
+                )
+                schema_mode = True
+            except Exception:
+                llm = llm.with_structured_output(
+                    pydantic_model,
+                    method="json_mode",
+                )
+        else:
+            llm = llm.with_structured_output(
+                pydantic_model,
+                method="json_mode",
+            )
+
+    for attempt in range(max_retries):
+        try:
+            result = await llm.ainvoke(prompt)
+
+            if model_info and not model_info.has_json_mode():
+                parsed_result = extract_json_from_response(result.content)
+                if parsed_result:
+                    # Validate before returning or caching (see call_llm)
+                    validated = pydantic_model(**parsed_result)
+                    if cache_key is not None:
+                        _response_cache_put(cache_key, validated.model_dump_json())
+                    return validated.model_dump() if return_dict else validated
+            elif schema_mode:
+                if cache_key is not None:
+                    _response_cache_put(cache_key, json.dumps(result))
+                return result if return_dict else pydantic_model.model_validate(result)
+            else:
+                if cache_key is not None:
+                    _response_cache_put(cache_key, result.model_dump_json())
+                return result.model_dump() if return_dict else result
+
+        except Exception as e:
+            if agent_name:
+                progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
+
+            if attempt == max_retries - 1:
+                print(f"Error in LLM call after {max_retries} attempts: {e}")
+                default = default_factory() if default_factory else create_default_response(pydantic_model)
+                return default.model_dump() if return_dict else default
+
+    default = create_default_response(pydantic_model)
+    return default.model_dump() if return_dict else default
+
+
+def _mark_prompt_cache_points(prompt):
+    """
+    Attach Anthropic `cache_control` markers to the leading system messages.
+
+    Agents keep their static instruction/schema blocks at the head of the
+    prompt with all dynamic data in the trailing human message, so marking
+    the system prefix lets Anthropic serve it from the prompt cache.
+    Prompts without a message list (plain strings) pass through untouched.
+    """
+    messages = getattr(prompt, "messages", None)
+    if not messages:
+        return prompt
+
+    marked = []
+    in_prefix = True
+    changed = False
+    for msg in messages:
+        if in_prefix and isinstance(msg, SystemMessage) and isinstance(msg.content, str):
+            marked.append(
+                SystemMessage(
+                    content=[{"type": "text", "text": msg.content, "cache_control": {"type": "ephemeral"}}]
+                )
+            )
+            changed = True
+        else:
+            in_prefix = False
+            marked.append(msg)
+
+    return ChatPromptValue(messages=marked) if changed else prompt
+
+
+def call_llm_streaming(
+    prompt: any,
+    pydantic_model: type[BaseModel],
+    agent_name: str | None = None,
+    state: AgentState | None = None,
+) -> Iterator[dict]:
+    """
+    Streams an LLM call, yielding progressively more-complete parses of the JSON output.
+
+    Each yielded dict is the best-effort parse of the tokens received so far, so
+    consumers (UI, memo renderers) can start showing early fields (e.g. "thesis")
+    while later ones (e.g. "bear_case") are still generating. The final yielded
+    dict is the complete parse.
+
+    Args:
+        prompt: The prompt to send to the LLM
+        pydantic_model: The Pydantic model class describing the expected output
+        agent_name: Optional name of the agent for model config extraction
+        state: Optional state object to extract agent-specific model configuration
+
+    Yields:
+        Progressively more-complete dicts parsed from the streamed JSON
+    """
+    if state and agent_name:
+        model_name, model_provider = get_agent_model_config(state, agent_name)
+    else:
+        model_name = "gpt-4.1"
+        model_provider = "OPENAI"
+
+    api_keys = None
+    if state:
+        request = state.get("metadata", {}).get("request")
+        if request and hasattr(request, 'api_keys'):
+            api_keys = request.api_keys
+
+    llm = get_model(model_name, model_provider, api_keys)
+
+    buffer = ""
+    last_parsed = None
+    for chunk in llm.stream(prompt):
+        content = chunk.content
+        if isinstance(content, list):
+            # Some providers stream content as a list of blocks
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        if not content:
+            continue
+        buffer += content
+        parsed = parse_partial_json(buffer)
+        if parsed is not None and parsed != last_parsed:
+            last_parsed = parsed
+            yield parsed
+
+
+def parse_partial_json(content: str) -> dict | None:
+    """
+    Best-effort parse of a possibly-incomplete JSON object from streamed output.
+
+    Strips markdown fences, then tries a strict parse; if the JSON is still
+    mid-generation, closes any open strings/brackets and retries.
+    """
+    start = content.find("{")
+    if start == -1:
+        return None
+    text = content[start:]
+    fence_end = text.find("```")
+    if fence_end != -1:
+        text = text[:fence_end]
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Repair: walk the text tracking open strings and containers, then close them
+    stack = []
+    in_string = False
+    escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+
+    repaired = text
+    if escaped:
+        repaired = repaired[:-1]
+    if in_string:
+        repaired += '"'
+    repaired = repaired.rstrip()
+    if repaired.endswith((",", ":")):
+        repaired = repaired[:-1]
+    repaired += "".join(reversed(stack))
+    try:
+        parsed = json.loads(repaired)
+        return parsed if isinstance(parsed, dict) else None
+    except json.JSONDecodeError:
+        return None
 
 
 def create_default_response(model_class: type[BaseModel]) -> BaseModel:
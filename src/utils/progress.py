@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import threading
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -18,6 +19,8 @@ class AgentProgress:
         self.live = Live(self.table, console=console, refresh_per_second=4)
         self.started = False
         self.update_handlers: List[Callable[[str, Optional[str], str], None]] = []
+        # Agents may update status from worker threads
+        self._lock = threading.Lock()
 
     def register_handler(self, handler: Callable[[str, Optional[str], str], None]):
         """Register a handler to be called when agent status updates."""
@@ -43,26 +46,27 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
         """Update the status of an agent."""
-        if agent_name not in self.agent_status:
-            self.agent_status[agent_name] = {"status": "", "ticker": None}
-
-        if ticker:
-            self.agent_status[agent_name]["ticker"] = ticker
-        if status:
-            self.agent_status[agent_name]["status"] = status
-        if analysis:
-            self.agent_status[agent_name]["analysis"] = analysis
-        
-        # Set the timestamp as UTC datetime
-        timestamp = datetime.now(timezone.utc).isoformat()
-        self.agent_status[agent_name]["timestamp"] = timestamp
+        with self._lock:
+            if agent_name not in self.agent_status:
+                self.agent_status[agent_name] = {"status": "", "ticker": None}
+
+            if ticker:
+                self.agent_status[agent_name]["ticker"] = ticker
+            if status:
+                self.agent_status[agent_name]["status"] = status
+            if analysis:
+                self.agent_status[agent_name]["analysis"] = analysis
+
+            # Set the timestamp as UTC datetime
+            timestamp = datetime.now(timezone.utc).isoformat()
+            self.agent_status[agent_name]["timestamp"] = timestamp
+
+            self._refresh_display()
 
         # Notify all registered handlers
         for handler in self.update_handlers:
             handler(agent_name, ticker, status, analysis, timestamp)
 
-        self._refresh_display()
-
     def get_all_status(self):
         """Get the current status of all agents as a dictionary."""
         return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}